@@ -4,17 +4,21 @@ Example: Using the Validation System
 Demonstrates practical usage patterns for consulting outputs
 """
 
+import functools
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-sys.path.append(str(Path(__file__).parent))
+from typing import List, Optional
+sys.path.append(str(Path(__file__).parent.parent))
 
-from validation_interface import ValidationInterface
+from lithium_validation import ValidationInterface
 
-def example_consulting_report():
-    """Example: Validating a consulting recommendation"""
-    
-    # Sample consulting output
-    consulting_output = """
+_BANNER = "=" * 60
+
+# Sample outputs and sources, shared by the examples below
+
+# Sample consulting output
+CONSULTING_OUTPUT = """
     Based on our comprehensive market analysis, we recommend immediate expansion 
     into the Asian market. Data shows that 95% of similar companies have succeeded 
     with this strategy. The ROI is guaranteed to exceed 200% within 18 months.
@@ -24,42 +28,17 @@ def example_consulting_report():
     fully quantified at this time. Historical data from 2019-2023 supports this 
     recommendation, with consistent growth patterns observed across all sectors.
     """
-    
-    # Sources that might back this up
-    sources = [
-        "Market research from 2019-2023 shows 60-80% success rate for Asian expansion.",
-        "ROI varies between 50% and 300% depending on implementation strategy.",
-        "Phased approach recommended by McKinsey study on market entry.",
-        "Some sectors show inconsistent growth patterns in Asian markets."
-    ]
-    
-    # Initialize validator
-    validator = ValidationInterface()
-    
-    # Perform full validation
-    result = validator.full_validate(
-        consulting_output,
-        sources=sources,
-        scope="Strategic expansion recommendation",
-        domain="consulting"
-    )
-    
-    # Generate report
-    report = validator.generate_report(result, format='markdown')
-    
-    print("="*60)
-    print("CONSULTING OUTPUT VALIDATION")
-    print("="*60)
-    print(report)
-    
-    # Show how to iterate based on recommendations
-    if not result.passed:
-        print("\n" + "="*60)
-        print("APPLYING RECOMMENDATIONS")
-        print("="*60)
-        
-        # Revised version based on validation feedback
-        revised_output = """
+
+# Sources that might back this up
+CONSULTING_SOURCES = (
+    "Market research from 2019-2023 shows 60-80% success rate for Asian expansion.",
+    "ROI varies between 50% and 300% depending on implementation strategy.",
+    "Phased approach recommended by McKinsey study on market entry.",
+    "Some sectors show inconsistent growth patterns in Asian markets.",
+)
+
+# Revised version based on validation feedback
+REVISED_CONSULTING_OUTPUT = """
         Based on our comprehensive market analysis, we recommend a carefully 
         planned expansion into the Asian market. Market research indicates that 
         60-80% of similar companies have achieved positive outcomes with this 
@@ -77,25 +56,8 @@ def example_consulting_report():
         We recommend a phased implementation approach, as validated by McKinsey 
         research, with clearly defined go/no-go decision points at each stage.
         """
-        
-        # Re-validate
-        revised_result = validator.full_validate(
-            revised_output,
-            sources=sources,
-            scope="Strategic expansion recommendation - Revised",
-            domain="consulting"
-        )
-        
-        print(f"\nOriginal Score: {result.overall_score*100:.1f}%")
-        print(f"Revised Score: {revised_result.overall_score*100:.1f}%")
-        print(f"Risk Reduction: {result.hallucination_risk} -> {revised_result.hallucination_risk}")
-        print(f"Status: {'✅ Now Passing' if revised_result.passed else '❌ Still needs work'}")
 
-
-def example_technical_documentation():
-    """Example: Validating technical documentation"""
-    
-    technical_doc = """
+TECHNICAL_DOC = """
     The system uses a proprietary algorithm that solves NP-hard optimization 
     problems in polynomial time. Performance benchmarks show 100% accuracy 
     across all test cases. The implementation is bug-free and requires no 
@@ -106,56 +68,22 @@ def example_technical_documentation():
     unlimited concurrent users. Security has been validated using industry 
     best practices, though formal certification is pending.
     """
-    
-    sources = [
-        "NP-hard problems cannot be solved in polynomial time unless P=NP.",
-        "System testing showed 94% accuracy on standard benchmarks.",
-        "Microservices architecture implemented with 12 services.",
-        "Load testing successful up to 10,000 concurrent users."
-    ]
-    
-    validator = ValidationInterface()
-    result = validator.full_validate(technical_doc, sources, domain="technical")
-    
-    print("\n" + "="*60)
-    print("TECHNICAL DOCUMENTATION VALIDATION")
-    print("="*60)
-    
-    # Quick summary
-    quick_result = validator.quick_validate(technical_doc, sources)
-    print(f"Quick Check: {quick_result['score']}% - {quick_result['risk']} risk")
-    print(f"Key Issues: {', '.join(quick_result['key_issues'])}")
-    print(f"Recommendation: {quick_result['top_recommendation']}")
-
 
-def example_batch_validation():
-    """Example: Validating multiple outputs"""
-    
-    outputs = [
-        "Our analysis definitively proves the strategy will succeed.",
-        "Based on available data, we estimate a 70-80% probability of success, though several factors remain uncertain.",
-        "The data suggests positive outcomes, but we cannot determine the exact magnitude without further analysis.",
-    ]
-    
-    validator = ValidationInterface()
-    results = validator.batch_validate(outputs)
-    
-    print("\n" + "="*60)
-    print("BATCH VALIDATION RESULTS")
-    print("="*60)
-    
-    for i, (output, result) in enumerate(zip(outputs, results), 1):
-        print(f"\nOutput {i}: \"{output[:50]}...\"")
-        print(f"  Score: {result['score']}%")
-        print(f"  Risk: {result['risk']}")
-        print(f"  Passed: {'✅' if result['passed'] else '❌'}")
+TECHNICAL_SOURCES = (
+    "NP-hard problems cannot be solved in polynomial time unless P=NP.",
+    "System testing showed 94% accuracy on standard benchmarks.",
+    "Microservices architecture implemented with 12 services.",
+    "Load testing successful up to 10,000 concurrent users.",
+)
 
+BATCH_OUTPUTS = (
+    "Our analysis definitively proves the strategy will succeed.",
+    "Based on available data, we estimate a 70-80% probability of success, though several factors remain uncertain.",
+    "The data suggests positive outcomes, but we cannot determine the exact magnitude without further analysis.",
+)
 
-def example_with_context_model_protocol():
-    """Example: Integration with Context Model Protocol"""
-    
-    # This would integrate with your CMP from earlier
-    output = """
+# This would integrate with your CMP from earlier
+CMP_OUTPUT = """
     Following our Context Model Protocol pre-validation, this analysis 
     presents findings with explicit confidence levels:
     
@@ -171,36 +99,153 @@ def example_with_context_model_protocol():
     UNCERTAIN: Future regulatory changes could significantly impact 
     projections, but direction and magnitude cannot be determined.
     """
+
+
+@functools.lru_cache(maxsize=1)
+def _get_validator() -> ValidationInterface:
+    """Shared validator so each example reuses one initialized interface"""
+    return ValidationInterface()
+
+def _render(lines: List[str]) -> str:
+    """Join an example's output lines into one block of text"""
+    return "\n".join(lines) + "\n"
+
+def example_consulting_report(validator: Optional[ValidationInterface] = None) -> str:
+    """Example: Validating a consulting recommendation"""
+    out = []
     
-    validator = ValidationInterface()
-    result = validator.full_validate(output, scope="Market Analysis with CMP")
+    # Initialize validator
+    if validator is None:
+        validator = _get_validator()
     
-    print("\n" + "="*60)
-    print("CMP-ENHANCED OUTPUT VALIDATION")
-    print("="*60)
-    print(f"Score: {result.overall_score*100:.1f}%")
-    print(f"Passes CMP Standards: {'✅ YES' if result.passed else '❌ NO'}")
+    # Prepare sources once; both the original and revision reuse them
+    sources = validator.prepare_sources(CONSULTING_SOURCES)
+    
+    # Perform full validation
+    result = validator.full_validate(
+        CONSULTING_OUTPUT,
+        sources=sources,
+        scope="Strategic expansion recommendation",
+        domain="consulting"
+    )
+    
+    # Generate report
+    report = validator.generate_report(result, format='markdown')
+    
+    out.append(_BANNER)
+    out.append("CONSULTING OUTPUT VALIDATION")
+    out.append(_BANNER)
+    out.append(report)
+    
+    # Show how to iterate based on recommendations
+    if not result.passed:
+        out.append("\n" + _BANNER)
+        out.append("APPLYING RECOMMENDATIONS")
+        out.append(_BANNER)
+        
+        # Re-validate the revised version
+        revised_result = validator.full_validate(
+            REVISED_CONSULTING_OUTPUT,
+            sources=sources,
+            scope="Strategic expansion recommendation - Revised",
+            domain="consulting"
+        )
+        
+        out.append(f"\nOriginal Score: {result.overall_score*100:.1f}%")
+        out.append(f"Revised Score: {revised_result.overall_score*100:.1f}%")
+        out.append(f"Risk Reduction: {result.hallucination_risk} -> {revised_result.hallucination_risk}")
+        out.append(f"Status: {'✅ Now Passing' if revised_result.passed else '❌ Still needs work'}")
+    
+    return _render(out)
+
+
+def example_technical_documentation(validator: Optional[ValidationInterface] = None) -> str:
+    """Example: Validating technical documentation"""
+    out = []
+    
+    if validator is None:
+        validator = _get_validator()
+    sources = validator.prepare_sources(TECHNICAL_SOURCES)
+    result = validator.full_validate(TECHNICAL_DOC, sources, domain="technical")
+    
+    out.append("\n" + _BANNER)
+    out.append("TECHNICAL DOCUMENTATION VALIDATION")
+    out.append(_BANNER)
+    
+    # Quick summary
+    quick_result = validator.quick_validate(TECHNICAL_DOC, sources)
+    out.append(f"Quick Check: {quick_result['score']}% - {quick_result['risk']} risk")
+    out.append(f"Key Issues: {', '.join(quick_result['key_issues'])}")
+    out.append(f"Recommendation: {quick_result['top_recommendation']}")
+    
+    return _render(out)
+
+
+def example_batch_validation(validator: Optional[ValidationInterface] = None) -> str:
+    """Example: Validating multiple outputs"""
+    out = []
+    
+    if validator is None:
+        validator = _get_validator()
+    
+    out.append("\n" + _BANNER)
+    out.append("BATCH VALIDATION RESULTS")
+    out.append(_BANNER)
+    
+    for i, (output, result) in enumerate(validator.iter_validate(BATCH_OUTPUTS), 1):
+        out.append(f"\nOutput {i}: \"{output[:50]}...\"")
+        out.append(f"  Score: {result['score']}%")
+        out.append(f"  Risk: {result['risk']}")
+        out.append(f"  Passed: {'✅' if result['passed'] else '❌'}")
+    
+    return _render(out)
+
+
+def example_with_context_model_protocol(validator: Optional[ValidationInterface] = None) -> str:
+    """Example: Integration with Context Model Protocol"""
+    out = []
+    
+    if validator is None:
+        validator = _get_validator()
+    result = validator.full_validate(CMP_OUTPUT, scope="Market Analysis with CMP")
+    
+    out.append("\n" + _BANNER)
+    out.append("CMP-ENHANCED OUTPUT VALIDATION")
+    out.append(_BANNER)
+    out.append(f"Score: {result.overall_score*100:.1f}%")
+    out.append(f"Passes CMP Standards: {'✅ YES' if result.passed else '❌ NO'}")
     
     # Get statistics if running multiple validations
     stats = validator.get_statistics()
     if stats.get('total_validations', 0) > 0:
-        print(f"\nCumulative Stats:")
-        print(f"  Total Validations: {stats['total_validations']}")
-        print(f"  Pass Rate: {stats['pass_rate']*100:.1f}%")
-        print(f"  Average Score: {stats['average_score']*100:.1f}%")
+        out.append(f"\nCumulative Stats:")
+        out.append(f"  Total Validations: {stats['total_validations']}")
+        out.append(f"  Pass Rate: {stats['pass_rate']*100:.1f}%")
+        out.append(f"  Average Score: {stats['average_score']*100:.1f}%")
+    
+    return _render(out)
 
 
 if __name__ == "__main__":
     print("OUTPUT VALIDATION SYSTEM EXAMPLES")
     print("Based on 'Why Language Models Hallucinate' Paper")
-    print("="*60 + "\n")
-    
-    # Run examples
-    example_consulting_report()
-    example_technical_documentation()
-    example_batch_validation()
-    example_with_context_model_protocol()
-    
-    print("\n" + "="*60)
+    print(_BANNER + "\n")
+    
+    # Run the independent examples concurrently on the shared validator;
+    # output is written in order
+    validator = _get_validator()
+    examples = (example_consulting_report,
+                example_technical_documentation,
+                example_batch_validation)
+    with ThreadPoolExecutor(max_workers=len(examples)) as pool:
+        for output in pool.map(lambda example: example(validator), examples):
+            sys.stdout.write(output)
+    
+    # The CMP example reports statistics, so it runs once the others finish,
+    # on a cleared history so the figures cover only its own validation
+    validator.reset_statistics()
+    sys.stdout.write(example_with_context_model_protocol(validator))
+    
+    print("\n" + _BANNER)
     print("Examples completed. The validation system is ready for use.")
     print("Run 'python validate.py --help' for command-line usage.")
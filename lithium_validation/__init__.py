@@ -10,9 +10,13 @@ __version__ = "2.0.0"  # Updated for auto-validation
 __author__ = "Guillermo Espinosa"
 __email__ = "hola@ged.do"
 
+import copy
+
 # Core validation components
+from .core.cache import LRUCache, content_key
 from .core.validation_interface import (
     ValidationInterface,
+    SourceHandle,
     quick_check,
     quick_validate,
 )
@@ -22,21 +26,39 @@ from .core.validation_engine import (
     ConfidenceLevel,
 )
 
-# Auto-validation components (NEW)
-try:
-    from .mcp.auto_validator import (
-        AutoValidator,
-        ContentType,
-        ValidationMode,
-    )
-    auto_available = True
-except ImportError:
-    auto_available = False
-    AutoValidator = None
+# Auto-validation components (NEW), imported on first access
+_AUTO_EXPORTS = frozenset({"AutoValidator", "ContentType", "ValidationMode", "auto_available"})
+
+def _load_auto() -> bool:
+    """Import the auto-validation components; returns whether they are available"""
+    global AutoValidator, ContentType, ValidationMode, auto_available, _auto_validator
+    if 'auto_available' not in globals():
+        try:
+            from .mcp.auto_validator import (
+                AutoValidator,
+                ContentType,
+                ValidationMode,
+            )
+            auto_available = True
+            # Shared by every auto_validate call, so its analysis cache is reused
+            _auto_validator = AutoValidator()
+        except ImportError:
+            auto_available = False
+            AutoValidator = None
+    return auto_available
+
+def __getattr__(name: str):
+    # PEP 562: plain `import lithium_validation` skips auto_validator
+    if name in _AUTO_EXPORTS:
+        _load_auto()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     # Core components
     "ValidationInterface",
+    "SourceHandle",
     "OutputValidator",
     "ValidationResult",
     "ConfidenceLevel",
@@ -82,11 +104,23 @@ def auto_validate(content: str, enabled: bool = True) -> dict:
         >>> print(result['auto_decision']['message'])
         '⚠️ High-risk claim needs evidence'
     """
-    if not auto_available or not enabled:
+    if not enabled or not _load_auto():
         return {'enabled': False, 'message': 'Auto-validation not available or disabled'}
     
-    validator = AutoValidator()
-    validator.enabled = enabled
+    # Clients often resend identical content; reuse the earlier result
+    key = content_key(content)
+    result = _auto_cache.get(key)
+    if result is None:
+        result = _auto_validate(content)
+        _auto_cache.put(key, result)
+    return copy.deepcopy(result)
+
+# Results of auto_validate, keyed by content digest
+_auto_cache = LRUCache(maxsize=1024)
+
+def _auto_validate(content: str) -> dict:
+    """Run the auto-validation pipeline on content"""
+    validator = _auto_validator
     
     if not validator.should_validate(content):
         return {'skipped': True, 'reason': 'Content too short or not suitable for validation'}
@@ -104,7 +138,7 @@ def auto_validate(content: str, enabled: bool = True) -> dict:
     
     # Add auto-detection metadata
     return {
-        'score': round(result.overall_score * 100, 1),
+        'score': result.score_pct,
         'passed': result.passed,
         'risk': result.hallucination_risk,
         'auto_detected': {
@@ -9,13 +9,16 @@ import json
 import sys
 from pathlib import Path
 
-# Import from the lithium_validation package
-try:
-    from lithium_validation.core.validation_interface import ValidationInterface
-except ImportError:
-    # Fallback for development
-    sys.path.append(str(Path(__file__).parent.parent.parent))
-    from lithium_validation.core.validation_interface import ValidationInterface
+def _get_interface():
+    """Import and create the validation interface (deferred so --help stays fast)"""
+    # Import from the lithium_validation package
+    try:
+        from lithium_validation.core.validation_interface import ValidationInterface
+    except ImportError:
+        # Fallback for development
+        sys.path.append(str(Path(__file__).parent.parent.parent))
+        from lithium_validation.core.validation_interface import ValidationInterface
+    return ValidationInterface()
 
 def main():
     parser = argparse.ArgumentParser(
@@ -94,7 +97,9 @@ Examples:
     args = parser.parse_args()
     
     # Initialize interface
-    interface = ValidationInterface()
+    interface = _get_interface()
+    # Importable now that _get_interface has located the package
+    from lithium_validation.core.validation_interface import read_text
     
     # Handle statistics request
     if args.stats:
@@ -107,8 +112,7 @@ Examples:
         content = args.text
     elif args.file:
         try:
-            with open(args.file, 'r') as f:
-                content = f.read()
+            content = read_text(args.file)
         except Exception as e:
             print(f"Error reading file {args.file}: {e}", file=sys.stderr)
             return 1
@@ -122,8 +126,7 @@ Examples:
     if args.sources:
         for source_path in args.sources:
             try:
-                with open(source_path, 'r') as f:
-                    sources.append(f.read())
+                sources.append(read_text(source_path))
             except Exception as e:
                 print(f"Warning: Could not read source {source_path}: {e}", 
                      file=sys.stderr)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Cache helpers shared by the validation interface and the MCP server
+Bounded LRU storage plus stable content-addressed keys
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional
+
+
+# Copying a ready hasher is cheaper than constructing one per key. blake2b
+# keeps up with typical KB-sized outputs; past a few MB a non-cryptographic
+# hash (e.g. xxh3_128) would be faster, but keys are not that hot
+_HASHER_TEMPLATE = hashlib.blake2b(digest_size=16)
+
+
+class LRUCache:
+    """
+    Bounded mapping that evicts the least recently used entry
+    Safe to share between worker threads
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (marking it recently used), or default"""
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return default
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting the oldest entries when over capacity"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return a cached value"""
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def clear(self):
+        """Drop all cached values"""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def content_key(content: str, sources: Optional[Iterable[str]] = None,
+                *extra: Hashable) -> tuple:
+    """
+    Build a stable cache key for validating content against sources
+
+    Unlike hash(), the blake2b digest is identical across processes and
+    does not collide on long inputs. Each text is length-prefixed, so no
+    split of the same characters between content and sources shares a
+    key. Sources are sorted because support counting does not depend on
+    their order.
+
+    Args:
+        content: Text being validated
+        sources: Optional source texts
+        extra: Additional hashable parameters (mode, domain, ...)
+
+    Returns:
+        Tuple of the 16-byte digest followed by the extra parameters
+    """
+    h = _HASHER_TEMPLATE.copy()
+    _update_field(h, content)
+    for source in sorted(sources or ()):
+        _update_field(h, source)
+    return (h.digest(),) + extra
+
+
+def _update_field(h, text: str):
+    """Feed one length-prefixed text field to a hasher"""
+    # Length prefixes keep field boundaries unambiguous whatever the text
+    # contains; surrogatepass accepts lone surrogates that JSON clients send
+    data = text.encode('utf-8', 'surrogatepass')
+    h.update(len(data).to_bytes(8, 'little'))
+    h.update(data)
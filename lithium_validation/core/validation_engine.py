@@ -9,10 +9,14 @@ This system implements a three-stage validation process:
 3. Quality Assurance Verification
 """
 
+import copy
 import json
 import re
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
+import string
+import sys
+from collections import Counter
+from typing import Dict, Iterator, List, Tuple, Optional, Any, Union
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
@@ -31,9 +35,78 @@ class ClaimType(Enum):
     ARBITRARY = "arbitrary"  # No pattern in data (singleton)
     COMPUTATIONAL = "computational"  # Requires complex calculation
 
+def _keyword_re(keywords: Tuple[str, ...]) -> 're.Pattern':
+    """One alternation matching any keyword as a plain substring"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+# Keyword lexicons, each compiled once into a single pattern. All of them
+# are matched against lowercased text, as substrings (no word boundaries).
+# They stay separate rather than fused into one multi-lexicon scan: each
+# check only needs a yes/no, and search() stops at the first hit, whereas
+# a fused finditer must report every hit of every lexicon (about 3-8x
+# slower on typical outputs)
+_SCOPE_RE = _keyword_re(('specifically', 'limited to', 'within', 'scope',
+                         'boundaries', 'constraints'))
+_TIME_MARKER_RE = _keyword_re(('currently', 'recently', 'historically',
+                               'previously', 'future'))
+_ABSTENTION_RE = _keyword_re((
+    "don't know", "uncertain", "cannot determine", "insufficient data",
+    "requires further", "unable to", "beyond scope", "cannot verify"
+))
+_HARD_RE = _keyword_re(('optimize', 'solve np-hard', 'factor large', 'decrypt',
+                        'break encryption', 'predict perfectly', 'guarantee optimal'))
+_ONE_SIDED_RE = _keyword_re(('always', 'never', 'all', 'none', 'every', 'no one'))
+_RECENCY_RE = _keyword_re(('latest', 'newest', 'most recent', 'cutting-edge',
+                           'state-of-the-art'))
+# Lookahead so overlapping names ("americasia") are all reported
+_LOCATION_RE = re.compile('(?=(america|europe|asia|western|eastern))')
+# Ambiguous terms only count as whole whitespace-separated words, so they
+# are looked up in a set rather than matched as substrings
+_AMBIGUOUS_TERMS = frozenset({'maybe', 'perhaps', 'might', 'could', 'possibly',
+                              'somewhat', 'relatively', 'fairly', 'quite'})
+
+# Claim type keywords in priority order, fused into one lookahead pattern
+# with a named group per type
+_CLAIM_TYPE_KEYWORDS = (
+    ('EMPIRICAL', ('data shows', 'evidence', 'study', 'research')),
+    ('INFERENTIAL', ('therefore', 'thus', 'implies', 'suggests')),
+    ('HYPOTHETICAL', ('might', 'could', 'possibly', 'hypothesis')),
+    ('COMPUTATIONAL', ('calculate', 'compute', 'algorithm')),
+)
+_CLAIM_TYPE_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{name}>{'|'.join(map(re.escape, keywords))})"
+    for name, keywords in _CLAIM_TYPE_KEYWORDS
+) + ')')
+_CLAIM_TYPE_PRIORITY = {name: i for i, (name, _) in enumerate(_CLAIM_TYPE_KEYWORDS)}
+
+# Words never used as claim keywords
+_STOPWORDS = frozenset({'that', 'this', 'with', 'from'})
+
+# Sentences (runs between terminators) and temporal markers, matched on
+# the original content
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+_DATE_RE = re.compile(r'\b\d{4}\b')
+_VERSION_RE = re.compile(r'v\d+|\d+\.\d+')
+
+def source_word_set(source_lower: str) -> frozenset:
+    """
+    Words of a lowercased source, for fast claim keyword lookups
+    
+    Includes each token both as split and with edge punctuation stripped.
+    Every entry is a substring of the source, so a hit here always agrees
+    with the substring check it short-circuits.
+    """
+    tokens = source_lower.split()
+    return frozenset(tokens).union(token.strip(string.punctuation) for token in tokens)
+
 @dataclass
 class ValidationResult:
     """Comprehensive validation results"""
+    # Declared by hand rather than dataclass(slots=True), which needs 3.10
+    __slots__ = ('timestamp', 'overall_score', 'confidence_distribution',
+                 'singleton_rate', 'validation_flags', 'recommendations',
+                 'passed', 'hallucination_risk')
+    
     timestamp: str
     overall_score: float
     confidence_distribution: Dict[str, float]
@@ -43,8 +116,42 @@ class ValidationResult:
     passed: bool
     hallucination_risk: str
     
+    def __post_init__(self):
+        # Risk levels are compared and used as table keys throughout;
+        # interning lets those checks succeed on identity
+        self.hallucination_risk = sys.intern(self.hallucination_risk)
+    
+    @property
+    def score_pct(self) -> float:
+        """Overall score as a percentage rounded to one decimal"""
+        return round(self.overall_score * 100, 1)
+    
     def to_dict(self):
-        return asdict(self)
+        # Same output as dataclasses.asdict without its recursive walk;
+        # containers are still copied so callers can't mutate the result
+        return {
+            'timestamp': self.timestamp,
+            'overall_score': self.overall_score,
+            'confidence_distribution': dict(self.confidence_distribution),
+            'singleton_rate': self.singleton_rate,
+            'validation_flags': list(self.validation_flags),
+            'recommendations': list(self.recommendations),
+            'passed': self.passed,
+            'hallucination_risk': self.hallucination_risk
+        }
+
+@dataclass
+class _ValidationContext:
+    """Text prepared once per validate_output call and shared by all stages"""
+    content: str
+    content_lower: str
+    claims: List[str]
+    # Lowercased claim by claim, matching how each claim is checked
+    claims_lower: List[str]
+    # Number of sources supporting each claim
+    support_counts: List[int]
+    # Heuristic type of each claim
+    claim_types: List[ClaimType]
 
 class OutputValidator:
     """
@@ -52,6 +159,10 @@ class OutputValidator:
     from the hallucination paper
     """
     
+    # Validators are created per interface and per override; fixed attributes
+    # keep each instance small and catch misspelled settings
+    __slots__ = ('singleton_threshold', 'minimum_sources', 'confidence_weights')
+    
     def __init__(self):
         self.singleton_threshold = 0.2  # 20% singleton rate threshold
         self.minimum_sources = 2  # Minimum sources for validation
@@ -61,6 +172,25 @@ class OutputValidator:
             ConfidenceLevel.LOW: 0.5,
             ConfidenceLevel.UNCERTAIN: 0.0
         }
+    
+    def with_settings(self, singleton_threshold: Optional[float] = None,
+                      minimum_sources: Optional[int] = None) -> 'OutputValidator':
+        """
+        Validator using per-call threshold overrides
+        
+        Returns a copy rather than mutating this instance, so concurrent
+        callers with different settings never see each other's values.
+        None keeps the current value; with no overrides, self is returned.
+        """
+        if singleton_threshold is None and minimum_sources is None:
+            return self
+        
+        validator = copy.copy(self)
+        if singleton_threshold is not None:
+            validator.singleton_threshold = singleton_threshold
+        if minimum_sources is not None:
+            validator.minimum_sources = minimum_sources
+        return validator
         
     def validate_output(self, 
                        content: str,
@@ -75,17 +205,18 @@ class OutputValidator:
         Returns:
             ValidationResult with comprehensive analysis
         """
-        metadata = metadata or {}
+        metadata = self.prepare_metadata(metadata)
+        ctx = self._build_context(content, metadata)
         
         # Stage 1: Pre-Validation
-        pre_validation = self._pre_validation_check(content, metadata)
+        pre_validation = self._pre_validation_check(ctx, metadata)
         
         # Stage 2: Output Generation Assessment
-        generation_assessment = self._assess_output_generation(content, metadata)
+        generation_assessment = self._assess_output_generation(ctx, metadata)
         
         # Stage 3: Quality Assurance
         quality_scores = self._quality_assurance_check(
-            content, metadata, pre_validation, generation_assessment
+            ctx, metadata, pre_validation, generation_assessment
         )
         
         # Compile final results
@@ -93,60 +224,129 @@ class OutputValidator:
             pre_validation, generation_assessment, quality_scores, metadata
         )
     
-    def _pre_validation_check(self, content: str, metadata: Dict) -> Dict:
+    def validate_batch(self, contents: List[str],
+                       metadata: Union[Dict, List[Dict], None] = None) -> List[ValidationResult]:
+        """
+        Validate many outputs in one call
+        
+        A single metadata dict is prepared once and shared by every output,
+        so its sources are lowercased and indexed once for the whole batch.
+        
+        Args:
+            contents: The output texts to validate
+            metadata: Metadata shared by all outputs, or a list with one
+                metadata dict per output
+            
+        Returns:
+            ValidationResult for each output, in order
+        """
+        if isinstance(metadata, list):
+            if len(metadata) != len(contents):
+                raise ValueError(
+                    f"Expected {len(contents)} metadata entries, got {len(metadata)}"
+                )
+            prepared = [self.prepare_metadata(entry) for entry in metadata]
+        else:
+            prepared = [self.prepare_metadata(metadata)] * len(contents)
+        
+        return [
+            self.validate_output(content, entry)
+            for content, entry in zip(contents, prepared)
+        ]
+    
+    def prepare_metadata(self, metadata: Optional[Dict] = None) -> Dict:
+        """
+        Normalize metadata so it can be shared across several validations
+        
+        Source texts are lowercased and indexed once here instead of once per
+        claim; batch callers pass the returned dict to every validate_output
+        call, which also shares the keyword-to-sources memo between them.
+        """
+        metadata = dict(metadata or {})
+        if '_sources_lower' not in metadata:
+            metadata['_sources_lower'] = [
+                source.lower() for source in metadata.get('sources', [])
+            ]
+        if '_sources_words' not in metadata:
+            metadata['_sources_words'] = [
+                source_word_set(source) for source in metadata['_sources_lower']
+            ]
+        metadata.setdefault('_keyword_masks', {})
+        return metadata
+    
+    def _build_context(self, content: str, metadata: Dict) -> _ValidationContext:
+        """Lowercase, split, type and count support for claims once per validation"""
+        sources = self._lowered_sources(metadata)
+        source_words = self._source_word_sets(metadata)
+        keyword_masks = metadata.get('_keyword_masks', {})
+        
+        # Claims stream straight into the per-claim lists; no intermediate
+        # list of raw sentences is built
+        ctx = _ValidationContext(content, content.lower(), [], [], [], [])
+        for claim in self._iter_claims(content):
+            claim_lower = claim.lower()
+            ctx.claims.append(claim)
+            ctx.claims_lower.append(claim_lower)
+            ctx.support_counts.append(
+                self._count_support(claim_lower, sources, source_words, keyword_masks)
+            )
+            ctx.claim_types.append(self._get_claim_type(claim_lower))
+        return ctx
+    
+    def _pre_validation_check(self, ctx: _ValidationContext, metadata: Dict) -> Dict:
         """
         Stage 1: Pre-Validation Check
         Implements the paper's query classification and context enrichment
         """
         results = {
-            'claim_types': self._classify_claims(content),
-            'ambiguity_score': self._check_ambiguity(content),
-            'scope_defined': self._verify_scope(content, metadata),
-            'temporal_context': self._check_temporal_context(content),
+            'claim_types': self._classify_claims(ctx.claim_types),
+            'ambiguity_score': self._check_ambiguity(ctx.content_lower),
+            'scope_defined': self._verify_scope(ctx.content_lower, metadata),
+            'temporal_context': self._check_temporal_context(ctx),
             'source_count': len(metadata.get('sources', [])),
-            'has_abstentions': self._check_for_abstentions(content)
+            'has_abstentions': self._check_for_abstentions(ctx.content_lower)
         }
         
         # Check for singleton patterns (arbitrary facts)
-        results['singleton_claims'] = self._identify_singletons(content, metadata)
+        results['singleton_claims'] = self._identify_singletons(ctx, metadata)
         
         return results
     
-    def _assess_output_generation(self, content: str, metadata: Dict) -> Dict:
+    def _assess_output_generation(self, ctx: _ValidationContext, metadata: Dict) -> Dict:
         """
         Stage 2: Output Generation Assessment
         Evaluates confidence distribution and claim support
         """
-        claims = self._extract_claims(content)
-        
+        confidence_counts = Counter()
         assessment = {
-            'total_claims': len(claims),
+            'total_claims': len(ctx.claims),
             'confidence_distribution': {},
             'unsupported_claims': [],
             'cross_validated': [],
             'computational_hardness': []
         }
         
-        for claim in claims:
-            confidence = self._assess_claim_confidence(claim, metadata)
-            claim_type = self._get_claim_type(claim)
+        # One pass per claim over the support counts and types from the context
+        for claim, claim_lower, support_count, claim_type in zip(
+                ctx.claims, ctx.claims_lower, ctx.support_counts, ctx.claim_types):
+            confidence = self._assess_claim_confidence(claim_type, support_count)
             
             # Track confidence distribution
-            if confidence.name not in assessment['confidence_distribution']:
-                assessment['confidence_distribution'][confidence.name] = 0
-            assessment['confidence_distribution'][confidence.name] += 1
+            confidence_counts[confidence.name] += 1
             
             # Check support
-            if not self._is_claim_supported(claim, metadata):
+            if not self._is_claim_supported(support_count):
                 assessment['unsupported_claims'].append(claim)
             
             # Check for computational intractability
-            if self._is_computationally_hard(claim):
+            if self._is_computationally_hard(claim_lower):
                 assessment['computational_hardness'].append(claim)
-                
+        
+        # Plain dict (in first-seen order) for the result and its serialization
+        assessment['confidence_distribution'] = dict(confidence_counts)
         return assessment
     
-    def _quality_assurance_check(self, content: str, metadata: Dict,
+    def _quality_assurance_check(self, ctx: _ValidationContext, metadata: Dict,
                                 pre_validation: Dict, 
                                 generation_assessment: Dict) -> Dict:
         """
@@ -170,22 +370,19 @@ class OutputValidator:
         )
         
         # Calculate confidence-weighted score
+        # Distribution keys are level names; key the weights the same way
+        # instead of resolving each name back to its enum member
         conf_dist = generation_assessment['confidence_distribution']
-        weighted_score = 0
-        total_weight = 0
-        
-        for level_name, count in conf_dist.items():
-            level = ConfidenceLevel[level_name]
-            weight = self.confidence_weights[level]
-            weighted_score += weight * count
-            total_weight += count
-            
+        weights = {level.name: weight for level, weight in self.confidence_weights.items()}
+        weighted_score = sum(weights[name] * count for name, count in conf_dist.items())
+        total_weight = sum(conf_dist.values())
+        
         quality_scores['confidence_weighted_score'] = (
             weighted_score / total_weight if total_weight > 0 else 0
         )
         
         # Bias detection
-        quality_scores['bias_checks'] = self._check_biases(content)
+        quality_scores['bias_checks'] = self._check_biases(ctx.content_lower)
         
         # Calculate hallucination risk based on paper's formulas
         quality_scores['hallucination_risk'] = self._calculate_hallucination_risk(
@@ -244,9 +441,8 @@ class OutputValidator:
         )
     
     # Helper methods
-    def _classify_claims(self, content: str) -> Dict[str, int]:
-        """Classify claims by type"""
-        claims = self._extract_claims(content)
+    def _classify_claims(self, claim_types: List[ClaimType]) -> Dict[str, int]:
+        """Count claims by type"""
         classification = {
             ClaimType.EMPIRICAL.value: 0,
             ClaimType.INFERENTIAL.value: 0,
@@ -255,112 +451,162 @@ class OutputValidator:
             ClaimType.COMPUTATIONAL.value: 0
         }
         
-        for claim in claims:
-            claim_type = self._get_claim_type(claim)
-            classification[claim_type.value] += 1
-            
+        # Every type is already a key, so update() keeps the order above
+        classification.update(Counter(claim_type.value for claim_type in claim_types))
         return classification
     
     def _extract_claims(self, content: str) -> List[str]:
         """Extract individual claims from content"""
+        return list(self._iter_claims(content))
+    
+    def _iter_claims(self, content: str) -> Iterator[str]:
+        """Yield individual claims from content one at a time"""
         # Simple sentence splitting for now
         # In production, use NLP for better extraction
-        sentences = re.split(r'[.!?]+', content)
-        claims = [s.strip() for s in sentences if s.strip()]
-        return claims
-    
-    def _get_claim_type(self, claim: str) -> ClaimType:
-        """Determine the type of a claim"""
-        claim_lower = claim.lower()
-        
-        # Heuristic classification
-        if any(word in claim_lower for word in ['data shows', 'evidence', 'study', 'research']):
-            return ClaimType.EMPIRICAL
-        elif any(word in claim_lower for word in ['therefore', 'thus', 'implies', 'suggests']):
-            return ClaimType.INFERENTIAL
-        elif any(word in claim_lower for word in ['might', 'could', 'possibly', 'hypothesis']):
-            return ClaimType.HYPOTHETICAL
-        elif any(word in claim_lower for word in ['calculate', 'compute', 'algorithm']):
-            return ClaimType.COMPUTATIONAL
-        else:
-            return ClaimType.ARBITRARY
+        for match in _SENTENCE_RE.finditer(content):
+            claim = match.group().strip()
+            if claim:
+                yield claim
     
-    def _check_ambiguity(self, content: str) -> float:
-        """Check for ambiguous language"""
-        ambiguous_terms = ['maybe', 'perhaps', 'might', 'could', 'possibly', 
-                          'somewhat', 'relatively', 'fairly', 'quite']
-        
-        words = content.lower().split()
-        ambiguous_count = sum(1 for word in words if word in ambiguous_terms)
+    def _get_claim_type(self, claim_lower: str) -> ClaimType:
+        """Determine the type of a (lowercased) claim"""
+        # Heuristic classification: the highest-priority type found wins
+        best = None
+        for match in _CLAIM_TYPE_RE.finditer(claim_lower):
+            name = match.lastgroup
+            if best is None or _CLAIM_TYPE_PRIORITY[name] < _CLAIM_TYPE_PRIORITY[best]:
+                best = name
+                if _CLAIM_TYPE_PRIORITY[name] == 0:
+                    break
+        return ClaimType[best] if best else ClaimType.ARBITRARY
+    
+    def _check_ambiguity(self, content_lower: str) -> float:
+        """Check for ambiguous language in lowercased content"""
+        words = content_lower.split()
+        ambiguous_count = sum(1 for word in words if word in _AMBIGUOUS_TERMS)
         
         return ambiguous_count / len(words) if words else 0
     
-    def _verify_scope(self, content: str, metadata: Dict) -> bool:
+    def _verify_scope(self, content_lower: str, metadata: Dict) -> bool:
         """Check if scope is properly defined"""
-        scope_indicators = ['specifically', 'limited to', 'within', 'scope', 
-                           'boundaries', 'constraints']
-        
-        has_scope_language = any(ind in content.lower() for ind in scope_indicators)
+        has_scope_language = bool(_SCOPE_RE.search(content_lower))
         has_scope_metadata = 'scope' in metadata
         
         return has_scope_language or has_scope_metadata
     
-    def _check_temporal_context(self, content: str) -> Dict[str, bool]:
+    def _check_temporal_context(self, ctx: _ValidationContext) -> Dict[str, bool]:
         """Check temporal context markers"""
         return {
-            'has_dates': bool(re.search(r'\b\d{4}\b', content)),
-            'has_time_markers': any(word in content.lower() for word in 
-                                   ['currently', 'recently', 'historically', 
-                                    'previously', 'future']),
-            'has_version_info': bool(re.search(r'v\d+|\d+\.\d+', content))
+            'has_dates': bool(_DATE_RE.search(ctx.content)),
+            'has_time_markers': bool(_TIME_MARKER_RE.search(ctx.content_lower)),
+            'has_version_info': bool(_VERSION_RE.search(ctx.content))
         }
     
-    def _check_for_abstentions(self, content: str) -> bool:
+    def _check_for_abstentions(self, content_lower: str) -> bool:
         """Check if output appropriately abstains when uncertain"""
-        abstention_phrases = [
-            "don't know", "uncertain", "cannot determine", "insufficient data",
-            "requires further", "unable to", "beyond scope", "cannot verify"
-        ]
-        
-        return any(phrase in content.lower() for phrase in abstention_phrases)
+        return bool(_ABSTENTION_RE.search(content_lower))
     
-    def _identify_singletons(self, content: str, metadata: Dict) -> List[str]:
+    def _identify_singletons(self, ctx: _ValidationContext, metadata: Dict) -> List[str]:
         """Identify singleton claims (appearing only once in sources)"""
         singletons = []
-        claims = self._extract_claims(content)
-        sources = metadata.get('sources', [])
         
-        for claim in claims:
+        for claim, appearances in zip(ctx.claims, ctx.support_counts):
             # Check if claim appears in only one source
-            appearances = sum(1 for source in sources 
-                            if self._claim_in_source(claim, source))
             if appearances <= 1:
                 singletons.append(claim)
                 
         return singletons
     
-    def _claim_in_source(self, claim: str, source: str) -> bool:
-        """Check if a claim appears in a source"""
+    def _lowered_sources(self, metadata: Dict) -> List[str]:
+        """Lowercased source texts, prepared once per metadata dict"""
+        if '_sources_lower' in metadata:
+            return metadata['_sources_lower']
+        return [source.lower() for source in metadata.get('sources', [])]
+    
+    def _source_word_sets(self, metadata: Dict) -> List[frozenset]:
+        """Word sets of the lowercased sources, prepared once per metadata dict"""
+        if '_sources_words' in metadata:
+            return metadata['_sources_words']
+        return [source_word_set(source) for source in self._lowered_sources(metadata)]
+    
+    def _claim_key_words(self, claim_lower: str) -> List[str]:
+        """Significant words used to match a (lowercased) claim against sources"""
+        return [w for w in claim_lower.split() 
+                if len(w) > 4 and w not in _STOPWORDS]
+    
+    def _count_support(self, claim_lower: str, sources: List[str],
+                       source_words: Optional[List[frozenset]] = None,
+                       keyword_masks: Optional[Dict[str, int]] = None) -> int:
+        """
+        Count the (lowercased) sources that contain a (lowercased) claim
+        
+        A source supports the claim when it contains at least half of the
+        claim's key words. Which sources contain each key word is computed
+        once and memoized in keyword_masks as a bitmask (bit i set when
+        source i contains it), so words shared between claims are never
+        rescanned.
+        """
         # Simplified check - in production use semantic similarity
-        key_words = [w for w in claim.lower().split() 
-                    if len(w) > 4 and w not in ['that', 'this', 'with', 'from']]
+        # Key words are extracted once per claim, not once per source
+        key_words = self._claim_key_words(claim_lower)
         
         if len(key_words) < 2:
-            return False
-            
-        matches = sum(1 for word in key_words if word in source.lower())
-        return matches >= len(key_words) * 0.5
+            return 0
+        
+        if source_words is None:
+            source_words = [frozenset()] * len(sources)
+        if keyword_masks is None:
+            keyword_masks = {}
+        
+        masks = []
+        for word in key_words:
+            mask = keyword_masks.get(word)
+            if mask is None:
+                mask = self._keyword_mask(word, sources, source_words)
+                keyword_masks[word] = mask
+            masks.append(mask)
+        
+        required = len(key_words) * 0.5
+        # Claims whose key words mostly appear in no source at all are
+        # rejected without looking at individual sources
+        if sum(1 for mask in masks if mask) < required:
+            return 0
+        
+        # Only sources containing at least one key word can qualify
+        candidates = 0
+        for mask in masks:
+            candidates |= mask
+        
+        support = 0
+        while candidates:
+            source_bit = candidates & -candidates
+            if sum(1 for mask in masks if mask & source_bit) >= required:
+                support += 1
+            candidates ^= source_bit
+        return support
     
-    def _assess_claim_confidence(self, claim: str, metadata: Dict) -> ConfidenceLevel:
-        """Assess confidence level for a specific claim"""
-        # Check claim support in metadata
-        sources = metadata.get('sources', [])
-        support_count = sum(1 for source in sources 
-                          if self._claim_in_source(claim, source))
-        
-        # Check claim type
-        claim_type = self._get_claim_type(claim)
+    def _keyword_mask(self, word: str, sources: List[str],
+                      source_words: List[frozenset]) -> int:
+        """
+        Bitmask of the (lowercased) sources containing word as a substring
         
+        Whole-word hits resolve with a set lookup (see source_word_set);
+        anything else falls back to the substring scan, so partial-word
+        matches still count.
+        """
+        mask = 0
+        for i, (source, words) in enumerate(zip(sources, source_words)):
+            if word in words or word in source:
+                mask |= 1 << i
+        return mask
+    
+    def _claim_in_source(self, claim_lower: str, source: str) -> bool:
+        """Check if a (lowercased) claim appears in a (lowercased) source"""
+        return self._count_support(claim_lower, [source]) > 0
+    
+    def _assess_claim_confidence(self, claim_type: ClaimType,
+                                 support_count: int) -> ConfidenceLevel:
+        """Assess confidence level for a claim of claim_type with support_count sources"""
         # Determine confidence based on support and type
         if support_count >= 3 and claim_type == ClaimType.EMPIRICAL:
             return ConfidenceLevel.HIGH
@@ -371,47 +617,35 @@ class OutputValidator:
         else:
             return ConfidenceLevel.UNCERTAIN
     
-    def _is_claim_supported(self, claim: str, metadata: Dict) -> bool:
-        """Check if a claim has adequate support"""
-        sources = metadata.get('sources', [])
-        support_count = sum(1 for source in sources 
-                          if self._claim_in_source(claim, source))
-        
+    def _is_claim_supported(self, support_count: int) -> bool:
+        """Check if a claim's support count is adequate"""
         return support_count >= self.minimum_sources
     
-    def _is_computationally_hard(self, claim: str) -> bool:
-        """Check if claim involves computationally intractable problems"""
-        hard_indicators = [
-            'optimize', 'solve np-hard', 'factor large', 'decrypt',
-            'break encryption', 'predict perfectly', 'guarantee optimal'
-        ]
-        
-        claim_lower = claim.lower()
-        return any(indicator in claim_lower for indicator in hard_indicators)
+    def _is_computationally_hard(self, claim_lower: str) -> bool:
+        """Check if a (lowercased) claim involves computationally intractable problems"""
+        return bool(_HARD_RE.search(claim_lower))
     
-    def _check_biases(self, content: str) -> Dict[str, bool]:
-        """Check for various biases mentioned in the paper"""
+    def _check_biases(self, content_lower: str) -> Dict[str, bool]:
+        """Check lowercased content for various biases mentioned in the paper"""
         return {
-            'confirmation_bias': self._check_confirmation_bias(content),
-            'recency_bias': self._check_recency_bias(content),
-            'geographic_bias': self._check_geographic_bias(content)
+            'confirmation_bias': self._check_confirmation_bias(content_lower),
+            'recency_bias': self._check_recency_bias(content_lower),
+            'geographic_bias': self._check_geographic_bias(content_lower)
         }
     
-    def _check_confirmation_bias(self, content: str) -> bool:
+    def _check_confirmation_bias(self, content_lower: str) -> bool:
         """Check for confirmation bias indicators"""
-        one_sided_terms = ['always', 'never', 'all', 'none', 'every', 'no one']
-        return any(term in content.lower() for term in one_sided_terms)
+        return bool(_ONE_SIDED_RE.search(content_lower))
     
-    def _check_recency_bias(self, content: str) -> bool:
+    def _check_recency_bias(self, content_lower: str) -> bool:
         """Check for recency bias"""
-        recency_terms = ['latest', 'newest', 'most recent', 'cutting-edge', 'state-of-the-art']
-        return any(term in content.lower() for term in recency_terms)
+        return bool(_RECENCY_RE.search(content_lower))
     
-    def _check_geographic_bias(self, content: str) -> bool:
+    def _check_geographic_bias(self, content_lower: str) -> bool:
         """Check for geographic bias"""
         # Simple check - in production use more sophisticated location detection
-        locations = ['america', 'europe', 'asia', 'western', 'eastern']
-        return sum(1 for loc in locations if loc in content.lower()) >= 2
+        # Distinct locations mentioned, not total mentions
+        return len(set(_LOCATION_RE.findall(content_lower))) >= 2
     
     def _calculate_hallucination_risk(self, quality_scores: Dict,
                                      generation_assessment: Dict) -> float:
@@ -544,6 +778,8 @@ class OutputValidator:
         return flags
 
 
+_shared_validator: Optional[OutputValidator] = None
+
 def validate_output(content: str, metadata: Optional[Dict] = None) -> ValidationResult:
     """
     Convenience function to validate output
@@ -555,5 +791,8 @@ def validate_output(content: str, metadata: Optional[Dict] = None) -> Validation
     Returns:
         ValidationResult with comprehensive analysis
     """
-    validator = OutputValidator()
-    return validator.validate_output(content, metadata)
+    global _shared_validator
+    # validate_output never mutates the validator, so one instance serves all calls
+    if _shared_validator is None:
+        _shared_validator = OutputValidator()
+    return _shared_validator.validate_output(content, metadata)
@@ -4,23 +4,192 @@ Validation Interface - Easy-to-use wrapper for the validation engine
 Provides quick validation checks and report generation
 """
 
+import copy
 import json
+import locale
+import mmap
+import os
+import stat
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, Hashable
 from datetime import datetime
 
-from .validation_engine import OutputValidator, ValidationResult, ConfidenceLevel
+from .cache import LRUCache
+from .validation_engine import (
+    OutputValidator, ValidationResult, ConfidenceLevel, source_word_set
+)
+
+
+class ResultCache:
+    """
+    Bounded LRU cache with expiry for validation results
+    Repeated validations of identical input skip the full pipeline
+    """
+    
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        self.ttl = ttl
+        self._entries = LRUCache(maxsize)
+    
+    def get(self, key: Hashable) -> Optional[ValidationResult]:
+        """Return a fresh copy of the cached result, or None on miss"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl:
+            self._entries.pop(key)
+            return None
+        
+        cached = copy.deepcopy(result)
+        cached.timestamp = datetime.now().isoformat()
+        return cached
+    
+    def put(self, key: Hashable, result: ValidationResult):
+        """Store a result, evicting the least recently used entry when full"""
+        self._entries.put(key, (time.monotonic(), copy.deepcopy(result)))
+    
+    def clear(self):
+        """Drop all cached results"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+@dataclass(frozen=True)
+class SourceHandle:
+    """Source texts prepared once for reuse across several validations"""
+    texts: Tuple[str, ...]
+    lowered: Tuple[str, ...]
+    words: Tuple[frozenset, ...] = ()
+    
+    def metadata(self) -> Dict:
+        """Source entries for validation metadata"""
+        metadata = {'sources': list(self.texts), '_sources_lower': list(self.lowered)}
+        if len(self.words) == len(self.texts):
+            metadata['_sources_words'] = list(self.words)
+        return metadata
+
+
+def read_text(path: str) -> str:
+    """
+    Read a text file like open(path).read(), decoding from mapped pages
+    
+    Skips the intermediate bytes object a buffered read builds, so peak
+    memory for large files is roughly the decoded text alone. Pipes, empty
+    files and files that report no size (such as procfs) are read normally.
+    """
+    encoding = locale.getpreferredencoding(False)
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        mm = None
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                pass
+        if mm is None:
+            text = str(f.read(), encoding)
+        else:
+            with mm:
+                text = str(mm, encoding)
+    # Same newline handling as text-mode open()
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+class _HistoryStats:
+    """
+    Running totals over a validation history
+    Kept up to date as results are recorded, so statistics never rescan it
+    Not thread-safe on its own; ValidationInterface updates it under a lock
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.passed = 0
+        self.score_sum = 0
+        self.singleton_sum = 0
+        self.risks = Counter()
+        self.flags = Counter()
+    
+    def add(self, result: ValidationResult):
+        """Fold one result into the totals"""
+        self.count += 1
+        self.passed += result.passed
+        self.score_sum += result.overall_score
+        self.singleton_sum += result.singleton_rate
+        self.risks[result.hallucination_risk] += 1
+        self.flags.update(result.validation_flags)
+    
+    def snapshot(self) -> '_HistoryStats':
+        """Copy of the totals that later updates do not affect"""
+        stats = copy.copy(self)
+        stats.risks = Counter(self.risks)
+        stats.flags = Counter(self.flags)
+        return stats
+    
+    @classmethod
+    def of(cls, history: List[ValidationResult]) -> '_HistoryStats':
+        """Totals for an existing history"""
+        stats = cls()
+        for result in history:
+            stats.add(result)
+        return stats
+
+
+Sources = Union[List[str], SourceHandle, None]
+
+
+# Below this many uncached items, pool startup costs more than it saves
+_MIN_PARALLEL_BATCH = 8
+
+# Per-process validator and source metadata used by batch pool workers
+_batch_validator = None
+_batch_metadata = None
+
+
+def _init_batch_worker(handle: SourceHandle, singleton_threshold: float,
+                       minimum_sources: int, confidence_weights: Dict):
+    """Build the worker's validator and prepare the shared sources once"""
+    global _batch_validator, _batch_metadata
+    _batch_validator = OutputValidator()
+    _batch_validator.singleton_threshold = singleton_threshold
+    _batch_validator.minimum_sources = minimum_sources
+    _batch_validator.confidence_weights = dict(confidence_weights)
+    _batch_metadata = _batch_validator.prepare_metadata(handle.metadata())
+
+
+def _batch_validate_worker(content: str) -> ValidationResult:
+    """Validate one batch item inside a process pool worker"""
+    return _batch_validator.validate_output(content, _batch_metadata)
+
 
 class ValidationInterface:
     """
     User-friendly interface for output validation
     """
     
-    def __init__(self, config_path: Optional[str] = None):
-        """Initialize with optional configuration"""
+    def __init__(self, config_path: Optional[str] = None,
+                 cache_size: int = 128, keep_history: bool = True):
+        """
+        Initialize with optional configuration
+        
+        With keep_history=False only the running statistics are kept, so
+        long-lived callers do not accumulate every ValidationResult.
+        """
         self.validator = OutputValidator()
+        self.keep_history = keep_history
         self.history = []
+        self._stats = _HistoryStats()
+        # Guards history and statistics; servers validate from worker threads
+        self._stats_lock = threading.Lock()
+        self.cache = ResultCache(maxsize=cache_size)
         self.config = self._load_config(config_path) if config_path else {}
         
     def _load_config(self, config_path: str) -> Dict:
@@ -32,59 +201,117 @@ class ValidationInterface:
             print(f"Warning: Could not load config from {config_path}: {e}")
             return {}
     
-    def quick_validate(self, content: str, sources: List[str] = None) -> Dict:
+    def prepare_sources(self, sources: Sources) -> SourceHandle:
+        """
+        Prepare source texts once for reuse
+        
+        Pass the returned handle as ``sources`` to any validate call that
+        checks against the same sources.
+        
+        Args:
+            sources: List of source texts (or an existing handle)
+            
+        Returns:
+            SourceHandle usable in place of the source list
+        """
+        if isinstance(sources, SourceHandle):
+            return sources
+        texts = tuple(sources or ())
+        lowered = tuple(text.lower() for text in texts)
+        return SourceHandle(texts, lowered, tuple(map(source_word_set, lowered)))
+    
+    def quick_validate(self, content: str, sources: Sources = None) -> Dict:
         """
         Quick validation with simple output
         
         Args:
             content: Text to validate
-            sources: Optional list of source texts
+            sources: Optional list of source texts or a prepared SourceHandle
             
         Returns:
             Simplified validation results
         """
-        metadata = {'sources': sources or []}
-        result = self.validator.validate_output(content, metadata)
+        handle = self.prepare_sources(sources)
+        result = self._cached_validate(
+            ('quick', content, handle.texts), content, handle.metadata()
+        )
+        return self._summarize(result)
+    
+    def _cached_validate(self, cache_key: tuple, content: str,
+                         metadata: Dict, **overrides) -> ValidationResult:
+        """Validate through the result cache and record in history"""
+        validator = self.validator.with_settings(**overrides)
+        cache_key = self._settings_key(cache_key, validator)
+        result = self.cache.get(cache_key)
+        if result is None:
+            result = validator.validate_output(content, metadata)
+            self.cache.put(cache_key, result)
         
-        # Store in history
-        self.history.append(result)
+        self.record(result)
+        return result
+    
+    def _settings_key(self, cache_key: tuple, validator: OutputValidator) -> tuple:
+        """Extend a cache key with the validator settings that affect verdicts"""
+        # Validator thresholds can be tuned at runtime and change verdicts
+        return cache_key + (validator.singleton_threshold,
+                            validator.minimum_sources)
+    
+    def record(self, result: ValidationResult):
+        """
+        Store a result in history and the running statistics
         
-        # Create simplified output
+        Also used for results validated elsewhere, such as in a worker
+        process, so they are counted like local validations.
+        """
+        with self._stats_lock:
+            if self.keep_history:
+                self.history.append(result)
+            self._stats.add(result)
+    
+    def _summarize(self, result: ValidationResult) -> Dict:
+        """Create simplified output from a full result"""
         return {
             'passed': result.passed,
-            'score': round(result.overall_score * 100, 1),
+            'score': result.score_pct,
             'risk': result.hallucination_risk,
             'key_issues': result.validation_flags[:3],  # Top 3 issues
             'top_recommendation': result.recommendations[0] if result.recommendations else None
         }
     
     def full_validate(self, content: str, 
-                     sources: List[str] = None,
+                     sources: Sources = None,
                      scope: str = None,
-                     domain: str = None) -> ValidationResult:
+                     domain: str = None,
+                     singleton_threshold: Optional[float] = None,
+                     minimum_sources: Optional[int] = None) -> ValidationResult:
         """
         Full validation with comprehensive metadata
         
         Args:
             content: Text to validate
-            sources: Optional list of source texts
+            sources: Optional list of source texts or a prepared SourceHandle
             scope: Scope definition
             domain: Domain/field of the content
+            singleton_threshold: Optional override for this call only
+            minimum_sources: Optional override for this call only
             
         Returns:
             Complete ValidationResult
         """
+        handle = self.prepare_sources(sources)
         metadata = {
-            'sources': sources or [],
+            **handle.metadata(),
             'scope': scope,
             'domain': domain,
             'timestamp': datetime.now().isoformat()
         }
         
-        result = self.validator.validate_output(content, metadata)
-        self.history.append(result)
-        
-        return result
+        return self._cached_validate(
+            ('full', content, handle.texts, scope, domain),
+            content, metadata,
+            singleton_threshold=singleton_threshold,
+            minimum_sources=minimum_sources
+        )
     
     def generate_report(self, result: ValidationResult, 
                        format: str = 'markdown') -> str:
@@ -107,7 +334,8 @@ class ValidationInterface:
     
     def _generate_markdown_report(self, result: ValidationResult) -> str:
         """Generate markdown format report"""
-        report = f"""# Validation Report
+        # Sections are collected and joined once rather than concatenated
+        parts = [f"""# Validation Report
 
 **Generated:** {result.timestamp}  
 **Overall Score:** {result.overall_score*100:.1f}%  
@@ -116,11 +344,11 @@ class ValidationInterface:
 
 ## Confidence Distribution
 
-"""
+"""]
         for level, count in result.confidence_distribution.items():
-            report += f"- **{level}:** {count} claims\n"
+            parts.append(f"- **{level}:** {count} claims\n")
         
-        report += f"""
+        parts.append(f"""
 
 ## Key Metrics
 
@@ -129,19 +357,19 @@ class ValidationInterface:
 
 ## Issues Found
 
-"""
+""")
         for flag in result.validation_flags:
-            report += f"- {flag.replace('_', ' ').title()}\n"
+            parts.append(f"- {flag.replace('_', ' ').title()}\n")
         
-        report += "\n## Recommendations\n\n"
+        parts.append("\n## Recommendations\n\n")
         for i, rec in enumerate(result.recommendations, 1):
-            report += f"{i}. {rec}\n"
+            parts.append(f"{i}. {rec}\n")
         
-        return report
+        return ''.join(parts)
     
     def _generate_text_report(self, result: ValidationResult) -> str:
         """Generate plain text report"""
-        report = f"""
+        parts = [f"""
 VALIDATION REPORT
 ================
 Generated: {result.timestamp}
@@ -150,15 +378,15 @@ Status: {'PASSED' if result.passed else 'FAILED'}
 Hallucination Risk: {result.hallucination_risk}
 
 ISSUES:
-"""
+"""]
         for flag in result.validation_flags:
-            report += f"  - {flag.replace('_', ' ')}\n"
+            parts.append(f"  - {flag.replace('_', ' ')}\n")
         
-        report += "\nRECOMMENDATIONS:\n"
+        parts.append("\nRECOMMENDATIONS:\n")
         for i, rec in enumerate(result.recommendations, 1):
-            report += f"  {i}. {rec}\n"
+            parts.append(f"  {i}. {rec}\n")
         
-        return report
+        return ''.join(parts)
     
     def validate_file(self, file_path: str, 
                      source_files: List[str] = None) -> ValidationResult:
@@ -173,36 +401,109 @@ ISSUES:
             ValidationResult
         """
         # Read content
-        with open(file_path, 'r') as f:
-            content = f.read()
+        content = read_text(file_path)
         
         # Read sources if provided
         sources = []
         if source_files:
             for source_path in source_files:
                 try:
-                    with open(source_path, 'r') as f:
-                        sources.append(f.read())
+                    sources.append(read_text(source_path))
                 except Exception as e:
                     print(f"Warning: Could not read source {source_path}: {e}")
         
         return self.full_validate(content, sources)
     
-    def batch_validate(self, contents: List[str]) -> List[Dict]:
+    def batch_validate(self, contents: List[str],
+                       sources: Sources = None,
+                       max_workers: Optional[int] = None) -> List[Dict]:
         """
         Validate multiple outputs
         
+        Sources are shared by every output and prepared only once.
+        
         Args:
             contents: List of content strings to validate
+            sources: Optional source texts (or SourceHandle) shared by all outputs
+            max_workers: Spread uncached items over this many processes;
+                None validates serially in this process
             
         Returns:
             List of simplified validation results
         """
-        results = []
-        for content in contents:
-            results.append(self.quick_validate(content))
+        if max_workers is not None and max_workers > 1:
+            return self._parallel_validate(list(contents), sources, max_workers)
+        return [result for _, result in self.iter_validate(contents, sources)]
+    
+    def _parallel_validate(self, contents: List[str], sources: Sources,
+                           max_workers: int) -> List[Dict]:
+        """
+        Validate a batch across a process pool
+        
+        Cache lookups, history and statistics stay in this process, so
+        the outcome matches the serial path.
+        """
+        handle = self.prepare_sources(sources)
+        validator = self.validator
+        keys = [self._settings_key(('quick', content, handle.texts), validator)
+                for content in contents]
+        results = [self.cache.get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+        
+        if len(pending) < _MIN_PARALLEL_BATCH:
+            metadata = validator.prepare_metadata(handle.metadata())
+            computed = [validator.validate_output(contents[i], metadata)
+                        for i in pending]
+        else:
+            workers = min(max_workers, len(pending))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_batch_worker,
+                initargs=(handle, validator.singleton_threshold,
+                          validator.minimum_sources, validator.confidence_weights)
+            ) as pool:
+                computed = list(pool.map(
+                    _batch_validate_worker, [contents[i] for i in pending],
+                    chunksize=max(1, len(pending) // (workers * 4))
+                ))
         
-        return results
+        for i, result in zip(pending, computed):
+            results[i] = result
+            self.cache.put(keys[i], result)
+        for result in results:
+            self.record(result)
+        return [self._summarize(result) for result in results]
+    
+    def iter_validate(self, contents: Iterable[str],
+                      sources: Sources = None) -> Iterator[Tuple[str, Dict]]:
+        """
+        Validate multiple outputs lazily
+        
+        Yields each result as soon as it is ready, so large batches never
+        hold every result in memory at once.
+        
+        Args:
+            contents: Iterable of content strings to validate
+            sources: Optional source texts (or SourceHandle) shared by all outputs
+            
+        Yields:
+            (content, simplified validation result) pairs
+        """
+        handle = self.prepare_sources(sources)
+        # Prepared once so the whole batch shares the validator's source memo
+        metadata = self.validator.prepare_metadata(handle.metadata())
+        
+        for content in contents:
+            result = self._cached_validate(
+                ('quick', content, handle.texts), content, metadata
+            )
+            yield content, self._summarize(result)
+    
+    def reset_statistics(self):
+        """Clear validation history so statistics start fresh"""
+        with self._stats_lock:
+            self.history.clear()
+            self._stats = _HistoryStats()
     
     def get_statistics(self) -> Dict:
         """
@@ -211,25 +512,26 @@ ISSUES:
         Returns:
             Statistics dictionary
         """
-        if not self.history:
+        with self._stats_lock:
+            # The running totals only miss entries if history was edited directly
+            if self.keep_history and self._stats.count != len(self.history):
+                self._stats = _HistoryStats.of(self.history)
+            stats = self._stats.snapshot()
+        
+        if not stats.count:
             return {'message': 'No validation history available'}
         
-        passed_count = sum(1 for r in self.history if r.passed)
-        total_count = len(self.history)
+        passed_count = stats.passed
+        total_count = stats.count
         
-        avg_score = sum(r.overall_score for r in self.history) / total_count
-        avg_singleton = sum(r.singleton_rate for r in self.history) / total_count
+        avg_score = stats.score_sum / total_count
+        avg_singleton = stats.singleton_sum / total_count
         
         risk_distribution = {
-            'LOW': sum(1 for r in self.history if r.hallucination_risk == 'LOW'),
-            'MEDIUM': sum(1 for r in self.history if r.hallucination_risk == 'MEDIUM'),
-            'HIGH': sum(1 for r in self.history if r.hallucination_risk == 'HIGH')
+            level: stats.risks[level] for level in ('LOW', 'MEDIUM', 'HIGH')
         }
         
-        common_flags = {}
-        for result in self.history:
-            for flag in result.validation_flags:
-                common_flags[flag] = common_flags.get(flag, 0) + 1
+        common_flags = stats.flags
         
         return {
             'total_validations': total_count,
@@ -239,8 +541,7 @@ ISSUES:
             'average_score': avg_score,
             'average_singleton_rate': avg_singleton,
             'risk_distribution': risk_distribution,
-            'common_issues': sorted(common_flags.items(), 
-                                   key=lambda x: x[1], reverse=True)[:5]
+            'common_issues': common_flags.most_common(5)
         }
 
 
@@ -253,7 +554,7 @@ def quick_check(content: str, sources: List[str] = None, domain: str = None) ->
         result = interface.full_validate(content, sources, domain=domain)
         return {
             'passed': result.passed,
-            'score': round(result.overall_score * 100, 1),
+            'score': result.score_pct,
             'risk': result.hallucination_risk,
             'key_issues': result.validation_flags[:3],
             'top_recommendation': result.recommendations[0] if result.recommendations else None
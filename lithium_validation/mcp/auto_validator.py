@@ -4,10 +4,43 @@ Lithium Auto-Validator Module
 Intelligent content detection and automatic validation selection
 """
 
+import copy
 import re
+from itertools import islice
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
+from ..core.cache import LRUCache, content_key
+
+# Source extraction and content filtering patterns, compiled once.
+# Quotes of up to 50 characters still match (keeping quote pairing intact)
+# but leave the group empty, so no string is built for them
+_QUOTE_RE = re.compile(r'"(?:([^"]{51,})|[^"]+)"')
+_DATA_REF_RE = re.compile(
+    r'(?:data shows?|study finds?|research indicates?|according to)[^.]+\.', re.IGNORECASE
+)
+# Most sources extract_sources_from_content returns
+_MAX_SOURCES = 5
+# Every byte except ASCII letters; deleting these from the ASCII-encoded
+# content leaves exactly the [a-zA-Z] characters, without a list of matches
+_NON_LETTER_BYTES = bytes(b for b in range(256) if not (65 <= b <= 90 or 97 <= b <= 122))
+
+
+def _fuse(patterns: List['re.Pattern']) -> 're.Pattern':
+    """
+    One alternation matching whatever any of the patterns matches
+    
+    Only exact when no two patterns can match overlapping text, which
+    holds within each content type and risk level (but not across them:
+    'hypothesis' scores for both consulting and research)
+    """
+    return re.compile('|'.join(f'(?:{p.pattern})' for p in patterns), re.IGNORECASE)
+
+
+def _count_up_to(regex: 're.Pattern', text: str, limit: int) -> int:
+    """Number of matches of regex in text, counting no further than limit"""
+    return sum(1 for _ in islice(regex.finditer(text), limit))
+
 class ContentType(Enum):
     """Auto-detected content types"""
     CONSULTING = "consulting"
@@ -88,61 +121,87 @@ class AutoValidator:
                 r'\b(further research|more data needed|limitations)\b'
             ]
         }
+        
+        # Compile every pattern once instead of on each detection call
+        self.content_patterns = {
+            content_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for content_type, patterns in self.content_patterns.items()
+        }
+        self.risk_patterns = {
+            level: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for level, patterns in self.risk_patterns.items()
+        }
+        
+        # One scan per content type / risk level rather than one per pattern.
+        # Content types sit in a tuple parallel to their regexes, so scoring
+        # indexes a plain list instead of hashing Enum members
+        self._content_types = tuple(self.content_patterns)
+        self._content_regexes = tuple(
+            _fuse(patterns) for patterns in self.content_patterns.values()
+        )
+        self._risk_regexes = {
+            level: _fuse(patterns) for level, patterns in self.risk_patterns.items()
+        }
+        
+        # get_auto_validation_params results by content digest
+        self._params_cache = LRUCache(maxsize=1024)
     
     def detect_content_type(self, content: str) -> Tuple[ContentType, float]:
         """Automatically detect the type of content"""
-        content_lower = content.lower()
-        scores = {}
-        
+        return self._detect_content_type(content.lower())
+    
+    def _detect_content_type(self, content_lower: str) -> Tuple[ContentType, float]:
+        """detect_content_type on already lowercased content"""
         # Score each content type
-        for content_type, patterns in self.content_patterns.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(re.findall(pattern, content_lower, re.IGNORECASE))
-                score += matches
-            scores[content_type] = score
+        scores = [
+            sum(1 for _ in regex.finditer(content_lower))
+            for regex in self._content_regexes
+        ]
         
-        # Get the highest scoring type
+        # Get the highest scoring type (the first one on ties)
         if scores:
-            best_type = max(scores, key=scores.get)
-            confidence = scores[best_type] / (sum(scores.values()) + 1)
+            best = max(range(len(scores)), key=scores.__getitem__)
+            confidence = scores[best] / (sum(scores) + 1)
             
             # If confidence is too low, default to general
             if confidence < 0.3:
                 return ContentType.GENERAL, confidence
-            return best_type, confidence
+            return self._content_types[best], confidence
         
         return ContentType.GENERAL, 0.0
     
     def detect_risk_level(self, content: str) -> str:
         """Detect the risk level of claims in the content"""
-        content_lower = content.lower()
-        
-        # Count risk indicators
-        high_risk_count = sum(
-            len(re.findall(pattern, content_lower, re.IGNORECASE))
-            for pattern in self.risk_patterns['high_risk']
-        )
-        medium_risk_count = sum(
-            len(re.findall(pattern, content_lower, re.IGNORECASE))
-            for pattern in self.risk_patterns['medium_risk']
-        )
-        low_risk_count = sum(
-            len(re.findall(pattern, content_lower, re.IGNORECASE))
-            for pattern in self.risk_patterns['low_risk']
-        )
+        return self._detect_risk_level(content.lower())
+    
+    def _detect_risk_level(self, content_lower: str) -> str:
+        """detect_risk_level on already lowercased content"""
+        # Count risk indicators; low-risk wording never changes the outcome,
+        # and medium-risk wording is only counted when high-risk is absent.
+        # Counts stop at the first value past their threshold
+        high_risk_count = _count_up_to(self._risk_regexes['high_risk'], content_lower, 3)
         
         # Determine overall risk
         if high_risk_count > 2:
             return "HIGH"
-        elif high_risk_count > 0 or medium_risk_count > 3:
+        elif high_risk_count > 0:
+            return "MEDIUM"
+        
+        medium_risk_count = _count_up_to(self._risk_regexes['medium_risk'], content_lower, 4)
+        if medium_risk_count > 3:
             return "MEDIUM"
         else:
             return "LOW"
     
-    def detect_validation_mode(self, content: str, content_type: ContentType) -> ValidationMode:
-        """Determine how strict validation should be"""
-        risk_level = self.detect_risk_level(content)
+    def detect_validation_mode(self, content: str, content_type: ContentType,
+                               risk_level: Optional[str] = None) -> ValidationMode:
+        """
+        Determine how strict validation should be
+        
+        Pass risk_level when it is already known to skip detecting it again.
+        """
+        if risk_level is None:
+            risk_level = self.detect_risk_level(content)
         
         # Creative content gets more permissive validation
         if content_type == ContentType.CREATIVE:
@@ -168,25 +227,42 @@ class AutoValidator:
         sources = []
         
         # Look for quoted text that might be sources
-        quotes = re.findall(r'"([^"]+)"', content)
-        sources.extend([q for q in quotes if len(q) > 50])
+        for match in _QUOTE_RE.finditer(content):
+            quote = match.group(1)
+            if quote is not None:
+                sources.append(quote)
+                if len(sources) == _MAX_SOURCES:
+                    return sources
         
         # Look for references to data or studies
-        data_refs = re.findall(r'(?:data shows?|study finds?|research indicates?|according to)[^.]+\.', 
-                               content, re.IGNORECASE)
-        sources.extend(data_refs)
+        for match in _DATA_REF_RE.finditer(content):
+            sources.append(match.group())
+            if len(sources) == _MAX_SOURCES:
+                break
         
-        return sources[:5]  # Limit to 5 sources
+        return sources
     
     def get_auto_validation_params(self, content: str) -> Dict:
         """
         Get automatic validation parameters based on content analysis
         Returns everything needed for validation without user input
         """
-        # Detect content characteristics
-        content_type, type_confidence = self.detect_content_type(content)
-        risk_level = self.detect_risk_level(content)
-        validation_mode = self.detect_validation_mode(content, content_type)
+        # The analysis depends only on the content, so repeats are served
+        # from the cache (as copies, since callers may modify the result)
+        key = content_key(content)
+        params = self._params_cache.get(key)
+        if params is None:
+            params = self._analyze(content)
+            self._params_cache.put(key, params)
+        return copy.deepcopy(params)
+    
+    def _analyze(self, content: str) -> Dict:
+        """Uncached get_auto_validation_params"""
+        # Detect content characteristics (lowercasing the content only once)
+        content_lower = content.lower()
+        content_type, type_confidence = self._detect_content_type(content_lower)
+        risk_level = self._detect_risk_level(content_lower)
+        validation_mode = self.detect_validation_mode(content, content_type, risk_level)
         sources = self.extract_sources_from_content(content)
         
         # Set parameters based on detected mode
@@ -232,11 +308,13 @@ class AutoValidator:
             return False
         
         # Skip pure code blocks
-        if content.strip().startswith('```') and content.strip().endswith('```'):
+        stripped = content.strip()
+        if stripped.startswith('```') and stripped.endswith('```'):
             return False
         
         # Skip content that's mostly numbers/data
-        alphanum_ratio = len(re.findall(r'[a-zA-Z]', content)) / (len(content) + 1)
+        letters = content.encode('ascii', 'ignore').translate(None, _NON_LETTER_BYTES)
+        alphanum_ratio = len(letters) / (len(content) + 1)
         if alphanum_ratio < 0.3:
             return False
         
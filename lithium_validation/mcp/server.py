@@ -10,25 +10,52 @@ Lithium: Stabilizing your outputs, reducing manic confidence swings.
 """
 
 import asyncio
+import functools
 import json
+import multiprocessing
+import os
+import re
+import string
 import sys
+import threading
+import time
 import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from datetime import datetime
 
-# Add validation system to path
-sys.path.append(str(Path(__file__).parent))
-
 # MCP imports
 import mcp.server.stdio
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
-# Import our validation system
-from validation_engine import OutputValidator, ValidationResult, ConfidenceLevel
-from validation_interface import ValidationInterface
+# Optional fast JSON serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional libuv-based event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Import our validation system from the lithium_validation package
+try:
+    from lithium_validation.core.cache import LRUCache, content_key
+    from lithium_validation.core.validation_engine import OutputValidator, ValidationResult, ConfidenceLevel
+    from lithium_validation.core.validation_interface import ValidationInterface
+except ImportError:
+    # Fallback for development
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+    from lithium_validation.core.cache import LRUCache, content_key
+    from lithium_validation.core.validation_engine import OutputValidator, ValidationResult, ConfidenceLevel
+    from lithium_validation.core.validation_interface import ValidationInterface
 
 # Configure logging
 logging.basicConfig(
@@ -37,6 +64,184 @@ logging.basicConfig(
 )
 logger = logging.getLogger('lithium')
 
+# Sentence splitter for claim extraction
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Words ignored when matching claims against sources
+_STOPWORDS = frozenset({'that', 'this', 'with', 'from', 'have', 'been'})
+
+# Claim type keywords, in priority order
+_CLAIM_TYPE_KEYWORDS = {
+    'empirical': ('data shows', 'evidence', 'study'),
+    'inferential': ('therefore', 'thus', 'implies'),
+    'hypothetical': ('might', 'could', 'possibly'),
+}
+_CLAIM_TYPE_PRIORITY = {claim_type: i for i, claim_type in enumerate(_CLAIM_TYPE_KEYWORDS)}
+# One named group per type; the lookahead reports overlapping hits such
+# as "thus" in "thustudy". Case folds during matching, so claims are
+# never lowercased
+_CLAIM_TYPE_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{claim_type}>{'|'.join(map(re.escape, keywords))})"
+    for claim_type, keywords in _CLAIM_TYPE_KEYWORDS.items()
+) + ')', re.IGNORECASE)
+
+# Risk score contribution and recommendation by hallucination risk level
+_RISK_WEIGHT = {"HIGH": 0.3, "MEDIUM": 0.15, "LOW": 0.0}
+_RISK_RECOMMENDATION = {
+    "HIGH": "Critical: Immediate stabilization needed - add sources and uncertainty acknowledgments",
+    "MEDIUM": "Moderate: Strengthen claim support and qualify uncertain statements",
+}
+
+# Improvement suggestions offered by lithium_stabilize. Read-only views,
+# shared by every response instead of copied per call
+_SINGLETON_SUGGESTION = MappingProxyType({
+    'type': 'reduce_singletons',
+    'priority': 'high',
+    'suggestion': 'Add cross-validation: Include "multiple sources confirm" or "consistently observed"',
+    'example': 'Replace "X is true" with "Multiple studies confirm X"'
+})
+# (validation flag, suggestion it triggers), in output order
+_FLAG_SUGGESTIONS = (
+    ('MISSING_UNCERTAINTY_ACKNOWLEDGMENT', MappingProxyType({
+        'type': 'add_uncertainty',
+        'priority': 'high',
+        'suggestion': 'Add uncertainty qualifiers where confidence is low',
+        'example': 'Add "preliminary data suggests" or "further research needed"'
+    })),
+    ('CONFIRMATION_BIAS', MappingProxyType({
+        'type': 'balance_perspective',
+        'priority': 'medium',
+        'suggestion': 'Include alternative viewpoints or caveats',
+        'example': 'Add "while X is common, exceptions include Y"'
+    })),
+)
+_SUGGESTION_FLAGS = frozenset(flag for flag, _ in _FLAG_SUGGESTIONS)
+
+# Simulated edits applied by lithium_stabilize, by suggestion type
+_UNCERTAINTY_RE = re.compile(r'\b(?:is|are|will|must)\b')
+_SINGLETON_PREFIX = "Based on multiple sources, "
+_SUGGESTION_EDITS = {
+    'add_uncertainty': lambda content: _UNCERTAINTY_RE.sub(r'likely \g<0>', content, count=1),
+    'reduce_singletons': lambda content: _SINGLETON_PREFIX + content,
+}
+
+# Domain-specific flags: (validation flag, domain flag it raises)
+_DOMAIN_FLAG_MAP = {
+    'consulting': (
+        ('MISSING_UNCERTAINTY_ACKNOWLEDGMENT', 'LACKS_EXECUTIVE_CONFIDENCE_FRAMING'),
+        ('HIGH_SINGLETON_RATE', 'INSUFFICIENT_MARKET_VALIDATION'),
+    ),
+    'technical': (
+        ('COMPUTATIONAL_INTRACTABILITY', 'UNREALISTIC_PERFORMANCE_CLAIMS'),
+        ('UNSUPPORTED_CLAIMS', 'MISSING_TECHNICAL_CITATIONS'),
+    ),
+    'research': (
+        ('HIGH_SINGLETON_RATE', 'NEEDS_PEER_REVIEW'),
+        ('CONFIRMATION_BIAS', 'LACKS_ALTERNATIVE_HYPOTHESES'),
+    ),
+}
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the read-only mappings shared between responses"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize a tool response as JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, indent=2, default=_json_default)
+    return json.dumps(obj, separators=(',', ':'), default=_json_default)
+
+
+# Per-process interface used by process pool workers
+_worker_interface = None
+
+
+def _full_validate_worker(content: str, sources: List[str],
+                          scope: Optional[str], domain: Optional[str],
+                          singleton_threshold: Optional[float],
+                          minimum_sources: Optional[int]) -> ValidationResult:
+    """Run a full validation inside a process pool worker"""
+    global _worker_interface
+    if _worker_interface is None:
+        _worker_interface = ValidationInterface(keep_history=False)
+    return _worker_interface.full_validate(
+        content, sources, scope, domain,
+        singleton_threshold=singleton_threshold,
+        minimum_sources=minimum_sources
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _source_index(source: str) -> Tuple[str, frozenset]:
+    """Lowercased source text and its word set, computed once per source"""
+    lowered = source.lower()
+    tokens = lowered.split()
+    # Edge-stripped tokens are still substrings of the source, so a set hit
+    # on "growth" from "growth." agrees with the substring fallback
+    return lowered, frozenset(tokens).union(
+        token.strip(string.punctuation) for token in tokens
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _claim_keywords(claim: str) -> Tuple[str, ...]:
+    """Significant claim words, computed once per claim"""
+    return tuple(w for w in claim.lower().split() 
+                 if len(w) > 4 and w not in _STOPWORDS)
+
+
+def _preview(text: str, limit: int = 100) -> str:
+    """First limit characters of text, marked when truncated"""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}..."
+
+
+@functools.lru_cache(maxsize=4096)
+def _confidence_for_support(support_count: int) -> str:
+    """Confidence level for a claim backed by support_count sources"""
+    if support_count >= 3:
+        return "HIGH"
+    elif support_count >= 2:
+        return "MEDIUM"
+    elif support_count >= 1:
+        return "LOW"
+    else:
+        return "UNCERTAIN"
+
+
+@functools.lru_cache(maxsize=4096)
+def _claim_type(claim: str) -> str:
+    """Claim type (empirical, inferential, hypothetical, arbitrary)"""
+    # Single scan; the highest-priority type found anywhere wins
+    best = None
+    for match in _CLAIM_TYPE_RE.finditer(claim):
+        claim_type = match.lastgroup
+        if claim_type == "empirical":
+            return claim_type
+        if best is None or _CLAIM_TYPE_PRIORITY[claim_type] < _CLAIM_TYPE_PRIORITY[best]:
+            best = claim_type
+    return best or "arbitrary"
+
+
+@functools.lru_cache(maxsize=4096)
+def _stability_level(score: float, risk: str) -> str:
+    """Stability level for an overall score and hallucination risk"""
+    if score >= 0.8 and risk == "LOW":
+        return "HIGHLY STABLE"
+    elif score >= 0.6 and risk != "HIGH":
+        return "MODERATELY STABLE"
+    else:
+        return "UNSTABLE"
+
+
 class LithiumMCPServer:
     """
     Lithium Validation Framework MCP Server
@@ -45,15 +250,58 @@ class LithiumMCPServer:
     
     def __init__(self):
         self.server = Server("lithium")
-        self.validator = ValidationInterface()
-        self.cache = {}  # Simple cache for repeated validations
+        # Created on first use so cold starts stay cheap
+        self._validator = None
+        self._validator_lock = threading.Lock()
         self.config = self._load_config()
+        # Bounded cache for repeated validations
+        self.cache = LRUCache(maxsize=self.config.get('cache_max', 512))
+        # Validation results shared by every tool
+        self._full_cache = LRUCache(maxsize=256)
+        self._quick_cache = LRUCache(maxsize=256)
+        self._claims_cache = LRUCache(maxsize=256)
+        # Rendered reports, so repeat requests skip rendering too
+        self._report_cache = LRUCache(maxsize=128)
+        # Worker threads for validating several contents at once; they share
+        # one ValidationInterface, which records results under a lock
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        # Worker processes for long, CPU-bound full validations, started on
+        # first use (see _get_cpu_pool)
+        self._cpu_pool = None
+        self._cpu_pool_enabled = self.config.get('process_pool', True)
+        self._cpu_pool_min_chars = self.config.get('process_pool_min_chars', 1024)
+        # Compact responses are smaller to escape and send over stdio
+        self._indent_responses = self.config.get('indent_responses', True)
         
         # Setup handlers
         self._setup_handlers()
         
         logger.info("Lithium Validation Framework initialized")
     
+    @property
+    def validator(self) -> ValidationInterface:
+        """Shared validation interface, created on first use"""
+        validator = self._validator
+        if validator is None:
+            # Batch validation may hit this from several worker threads
+            with self._validator_lock:
+                if self._validator is None:
+                    # The server never reports history, so only totals are kept
+                    self._validator = ValidationInterface(keep_history=False)
+                validator = self._validator
+        return validator
+    
+    def _get_cpu_pool(self) -> ProcessPoolExecutor:
+        """Process pool for long validations, created on first use"""
+        if self._cpu_pool is None:
+            # Spawned rather than forked: this process already runs threads
+            # and an event loop, which a forked child would inherit mid-state
+            self._cpu_pool = ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._cpu_pool
+    
     def _load_config(self) -> Dict:
         """Load configuration from config.json"""
         config_path = Path(__file__).parent / "config.json"
@@ -66,6 +314,17 @@ class LithiumMCPServer:
     
     def _setup_handlers(self):
         """Setup all MCP handlers"""
+        # Tool name -> handler coroutine
+        self._handlers = {
+            "lithium_validate": self._validate_output,
+            "lithium_validate_context": self._validate_with_context,
+            "lithium_risk_check": self._check_hallucination_risk,
+            "lithium_analyze_claims": self._validate_claims,
+            "lithium_report": self._get_validation_report,
+            "lithium_compare": self._batch_validate,
+            "lithium_stabilize": self._improve_output,
+            "lithium_batch": self._run_batch,
+        }
         
         @self.server.list_tools()
         async def handle_list_tools() -> list[types.Tool]:
@@ -268,6 +527,29 @@ class LithiumMCPServer:
                         },
                         "required": ["content"]
                     }
+                ),
+                
+                types.Tool(
+                    name="lithium_batch",
+                    description="[Lithium] Run several Lithium tool calls concurrently in one request.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "ops": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "name": {"type": "string"},
+                                        "arguments": {"type": "object"}
+                                    },
+                                    "required": ["name"]
+                                },
+                                "description": "Tool calls to run, as name/arguments pairs"
+                            }
+                        },
+                        "required": ["ops"]
+                    }
                 )
             ]
         
@@ -279,33 +561,18 @@ class LithiumMCPServer:
             """Handle Lithium tool calls"""
             
             try:
-                if name == "lithium_validate":
-                    result = await self._validate_output(arguments)
-                
-                elif name == "lithium_validate_context":
-                    result = await self._validate_with_context(arguments)
-                
-                elif name == "lithium_risk_check":
-                    result = await self._check_hallucination_risk(arguments)
-                
-                elif name == "lithium_analyze_claims":
-                    result = await self._validate_claims(arguments)
-                
-                elif name == "lithium_report":
-                    result = await self._get_validation_report(arguments)
-                
-                elif name == "lithium_compare":
-                    result = await self._batch_validate(arguments)
-                
-                elif name == "lithium_stabilize":
-                    result = await self._improve_output(arguments)
-                
-                else:
+                handler = self._handlers.get(name)
+                if handler is None:
                     result = f"Unknown Lithium tool: {name}"
+                else:
+                    result = await handler(arguments)
+                
+                if not isinstance(result, str):
+                    result = _dumps(result, self._indent_responses)
                 
                 return [types.TextContent(
                     type="text",
-                    text=result if isinstance(result, str) else json.dumps(result, indent=2)
+                    text=result
                 )]
                 
             except Exception as e:
@@ -322,25 +589,25 @@ class LithiumMCPServer:
         mode = args.get('mode', 'quick')
         
         # Check cache
-        cache_key = f"{hash(content)}_{hash(tuple(sources))}_{mode}"
-        if cache_key in self.cache:
+        cache_key = content_key(content, sources, mode)
+        result = self.cache.get(cache_key)
+        if result is not None:
             logger.info("Returning cached Lithium result")
-            result = self.cache[cache_key]
             result['cached'] = True
             return result
         
         # Perform validation
         if mode == 'quick':
-            result = self.validator.quick_validate(content, sources)
+            result = dict(self._quick_validate_cached(content, sources))
             result['framework'] = 'Lithium'
         else:
-            val_result = self.validator.full_validate(content, sources)
+            val_result = await self._full_validate_async(content, sources)
             
             if mode == 'detailed':
                 # Include detailed breakdown
                 result = {
                     'framework': 'Lithium - Detailed Analysis',
-                    'score': round(val_result.overall_score * 100, 1),
+                    'score': val_result.score_pct,
                     'stability': 'STABLE' if val_result.passed else 'UNSTABLE',
                     'risk': val_result.hallucination_risk,
                     'singleton_rate': round(val_result.singleton_rate * 100, 1),
@@ -356,7 +623,7 @@ class LithiumMCPServer:
                 # Standard full result
                 result = {
                     'framework': 'Lithium',
-                    'score': round(val_result.overall_score * 100, 1),
+                    'score': val_result.score_pct,
                     'stability': 'STABLE' if val_result.passed else 'UNSTABLE',
                     'risk': val_result.hallucination_risk,
                     'singleton_rate': round(val_result.singleton_rate * 100, 1),
@@ -365,7 +632,7 @@ class LithiumMCPServer:
                 }
         
         # Cache result
-        self.cache[cache_key] = result
+        self.cache.put(cache_key, result)
         
         return result
     
@@ -377,26 +644,22 @@ class LithiumMCPServer:
         scope = args.get('scope', '')
         threshold = args.get('confidence_threshold', 0.7)
         
-        # Apply domain-specific configuration
-        if domain in self.config.get('domain_specific_rules', {}):
-            domain_rules = self.config['domain_specific_rules'][domain]
-            # Adjust validator settings based on domain
-            self.validator.validator.singleton_threshold = domain_rules.get(
-                'singleton_threshold', 0.2
-            )
-            self.validator.validator.minimum_sources = domain_rules.get(
-                'minimum_sources', 2
-            )
+        # Domain-specific settings apply to this call only
+        domain_rules = self.config.get('domain_specific_rules', {}).get(domain, {})
         
         # Perform validation
-        result = self.validator.full_validate(content, sources, scope, domain)
+        result = await self._full_validate_async(
+            content, sources, scope, domain,
+            singleton_threshold=domain_rules.get('singleton_threshold'),
+            minimum_sources=domain_rules.get('minimum_sources')
+        )
         
         # Apply threshold check
         passed_threshold = result.overall_score >= threshold
         
         return {
             'framework': 'Lithium Context-Aware',
-            'score': round(result.overall_score * 100, 1),
+            'score': result.score_pct,
             'stability': 'STABLE' if (result.passed and passed_threshold) else 'UNSTABLE',
             'domain': domain,
             'scope': scope,
@@ -414,11 +677,11 @@ class LithiumMCPServer:
         sources = args.get('sources', [])
         
         # Quick validation
-        result = self.validator.full_validate(content, sources)
+        result = await self._full_validate_async(content, sources)
         
         # Calculate specific hallucination metrics
-        claims = self._extract_claims(content)
-        unsupported = self._count_unsupported_claims(claims, sources)
+        claims, support = self._analyze_claims_cached(content, sources)
+        unsupported = sum(1 for row in support if not any(row))
         
         return {
             'framework': 'Lithium Risk Assessment',
@@ -444,11 +707,11 @@ class LithiumMCPServer:
         unsupported_only = args.get('return_unsupported_only', False)
         
         # Extract and analyze claims
-        claims = self._extract_claims(content)
+        claims, support = self._analyze_claims_cached(content, sources)
         analyzed_claims = []
         
-        for claim in claims:
-            support_count = self._count_support(claim, sources)
+        for claim, row in zip(claims, support):
+            support_count = sum(row)
             confidence = self._assess_confidence(claim, support_count)
             
             claim_analysis = {
@@ -485,16 +748,26 @@ class LithiumMCPServer:
         format = args.get('format', 'summary')
         include_recs = args.get('include_recommendations', True)
         
-        # Perform full validation
-        result = self.validator.full_validate(content, sources)
-        
+        key = content_key(content, sources, format, include_recs,
+                          self._validator_settings())
+        report = self._report_cache.get(key)
+        if report is None:
+            # Perform full validation
+            result = await self._full_validate_async(content, sources)
+            report = self._render_report(result, format, include_recs)
+            self._report_cache.put(key, report)
+        return report
+    
+    def _render_report(self, result: ValidationResult, format: str,
+                       include_recs: bool) -> str:
+        """Render a validation result as a json, markdown or summary report"""
         if format == 'json':
             report_dict = result.to_dict()
             report_dict['framework'] = 'Lithium Validation Framework'
-            return json.dumps(report_dict, indent=2)
+            return _dumps(report_dict)
         
         elif format == 'markdown':
-            report = f"""# Lithium Validation Report
+            parts = [f"""# Lithium Validation Report
 
 **Framework:** Lithium - Validation Framework  
 **Generated:** {result.timestamp}  
@@ -504,11 +777,11 @@ class LithiumMCPServer:
 
 ## Confidence Distribution
 
-"""
+"""]
             for level, count in result.confidence_distribution.items():
-                report += f"- **{level}:** {count} claims\n"
+                parts.append(f"- **{level}:** {count} claims\n")
             
-            report += f"""
+            parts.append(f"""
 
 ## Key Metrics
 
@@ -517,16 +790,16 @@ class LithiumMCPServer:
 
 ## Issues Found
 
-"""
+""")
             for flag in result.validation_flags:
-                report += f"- {flag.replace('_', ' ').title()}\n"
+                parts.append(f"- {flag.replace('_', ' ').title()}\n")
             
             if include_recs and result.recommendations:
-                report += "\n## Stabilization Recommendations\n\n"
+                parts.append("\n## Stabilization Recommendations\n\n")
                 for i, rec in enumerate(result.recommendations, 1):
-                    report += f"{i}. {rec}\n"
+                    parts.append(f"{i}. {rec}\n")
             
-            return report
+            return "".join(parts)
         
         else:  # summary format
             summary = f"""**Lithium Validation Summary**
@@ -550,13 +823,25 @@ Singleton Rate: {result.singleton_rate*100:.1f}%
         sources = args.get('sources', [])
         compare = args.get('compare', True)
         
-        # Validate each content
+        # Validate contents concurrently, bounded by max_concurrent
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.config.get('max_concurrent', 8))
+        
+        async def validate_one(content: str) -> Dict:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    self._pool, self._quick_validate_cached, content, sources
+                )
+        
+        val_results = await asyncio.gather(
+            *(validate_one(content) for content in contents)
+        )
+        
         results = []
-        for i, content in enumerate(contents):
-            val_result = self.validator.quick_validate(content, sources)
+        for i, (content, val_result) in enumerate(zip(contents, val_results)):
             results.append({
                 'index': i,
-                'content_preview': content[:100] + '...' if len(content) > 100 else content,
+                'content_preview': _preview(content),
                 'score': val_result['score'],
                 'stability': 'STABLE' if val_result['passed'] else 'UNSTABLE',
                 'risk': val_result['risk']
@@ -573,21 +858,53 @@ Singleton Rate: {result.singleton_rate*100:.1f}%
         }
         
         if compare and len(results) > 1:
-            # Add comparative analysis
-            scores = [r['score'] for r in results]
+            # Add comparative analysis, tallied in a single pass; the total is
+            # summed in sorted order, and the score range comes from the ends
+            total = 0.0
+            all_stable = True
+            risk_counter = Counter()
+            for r in results:
+                total += r['score']
+                if r['stability'] != 'STABLE':
+                    all_stable = False
+                risk_counter[r['risk']] += 1
+            
             output['comparison'] = {
-                'average_score': round(sum(scores) / len(scores), 1),
-                'score_range': max(scores) - min(scores),
-                'all_stable': all(r['stability'] == 'STABLE' for r in results),
+                'average_score': round(total / len(results), 1),
+                'score_range': results[0]['score'] - results[-1]['score'],
+                'all_stable': all_stable,
                 'risk_distribution': {
-                    'LOW': sum(1 for r in results if r['risk'] == 'LOW'),
-                    'MEDIUM': sum(1 for r in results if r['risk'] == 'MEDIUM'),
-                    'HIGH': sum(1 for r in results if r['risk'] == 'HIGH')
+                    level: risk_counter[level] for level in ('LOW', 'MEDIUM', 'HIGH')
                 }
             }
         
         return output
     
+    async def _run_batch(self, args: dict) -> dict:
+        """Run several tool calls concurrently and return results in order"""
+        ops = args.get('ops', [])
+        
+        async def run_op(op: Dict) -> Any:
+            handler = self._handlers.get(op.get('name'))
+            # Nested batches are not allowed
+            if handler is None or op.get('name') == 'lithium_batch':
+                return f"Unknown Lithium tool: {op.get('name')}"
+            try:
+                return await handler(op.get('arguments', {}))
+            except Exception as e:
+                logger.error(f"Error in {op.get('name')}: {str(e)}")
+                return f"Lithium Error: {str(e)}"
+        
+        results = await asyncio.gather(*(run_op(op) for op in ops))
+        
+        return {
+            'framework': 'Lithium Batch',
+            'results': [
+                {'name': op.get('name'), 'result': result}
+                for op, result in zip(ops, results)
+            ]
+        }
+    
     async def _improve_output(self, args: dict) -> dict:
         """Stabilize output (lithium_stabilize)"""
         content = args['content']
@@ -597,19 +914,34 @@ Singleton Rate: {result.singleton_rate*100:.1f}%
         
         improvements = []
         current_content = content
+        prev_content = None
+        prev_score = -1.0
+        budget = self.config.get('stabilize_budget_s', 5.0)
+        budget_start = time.monotonic()
         
         for iteration in range(max_iterations):
             # Validate current version
-            result = self.validator.full_validate(current_content, sources)
+            result = await self._full_validate_async(current_content, sources)
             
             if result.overall_score >= target_score:
                 break
             
+            # Stop once suggestions no longer change the content or the score
+            if current_content == prev_content or result.overall_score <= prev_score + 0.01:
+                break
+            
+            # Return the best result so far rather than time out the client
+            if time.monotonic() - budget_start > budget:
+                logger.info("Lithium stabilization budget exhausted")
+                break
+            
+            prev_content, prev_score = current_content, result.overall_score
+            
             # Generate improvement suggestions
             suggestions = self._generate_improvements(result, current_content)
             improvements.append({
                 'iteration': iteration + 1,
-                'score': round(result.overall_score * 100, 1),
+                'score': result.score_pct,
                 'stability': 'STABLE' if result.passed else 'UNSTABLE',
                 'suggestions': suggestions
             })
@@ -619,12 +951,12 @@ Singleton Rate: {result.singleton_rate*100:.1f}%
                 current_content = self._apply_suggestion(current_content, suggestions[0])
         
         # Final validation
-        final_result = self.validator.full_validate(current_content, sources)
+        final_result = await self._full_validate_async(current_content, sources)
         
         return {
             'framework': 'Lithium Stabilization',
             'original_score': round(improvements[0]['score'], 1) if improvements else 100,
-            'final_score': round(final_result.overall_score * 100, 1),
+            'final_score': final_result.score_pct,
             'stability_achieved': final_result.overall_score >= target_score,
             'final_stability': 'STABLE' if final_result.passed else 'UNSTABLE',
             'iterations_used': len(improvements),
@@ -633,6 +965,70 @@ Singleton Rate: {result.singleton_rate*100:.1f}%
         }
     
     # Helper methods
+    def _validator_settings(self, singleton_threshold: Optional[float] = None,
+                            minimum_sources: Optional[int] = None) -> tuple:
+        """Effective validator thresholds (part of cache keys)"""
+        engine = self.validator.validator
+        return (
+            engine.singleton_threshold if singleton_threshold is None else singleton_threshold,
+            engine.minimum_sources if minimum_sources is None else minimum_sources
+        )
+    
+    async def _full_validate_async(self, content: str, sources: List[str],
+                                   scope: Optional[str] = None,
+                                   domain: Optional[str] = None,
+                                   singleton_threshold: Optional[float] = None,
+                                   minimum_sources: Optional[int] = None) -> ValidationResult:
+        """
+        Full validation memoized across tools (result is shared, read-only)
+        
+        Long content is validated in the process pool so CPU-bound work
+        does not block the event loop; short content stays in-process
+        where the IPC round trip would cost more than it saves.
+        """
+        settings = self._validator_settings(singleton_threshold, minimum_sources)
+        key = content_key(content, sources, scope, domain, settings)
+        result = self._full_cache.get(key)
+        if result is not None:
+            return result
+        
+        if self._cpu_pool_enabled and len(content) >= self._cpu_pool_min_chars:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._get_cpu_pool(), _full_validate_worker,
+                content, sources, scope, domain,
+                singleton_threshold, minimum_sources
+            )
+            # Workers keep their own interface; count the result here too
+            self.validator.record(result)
+        else:
+            result = self.validator.full_validate(
+                content, sources, scope, domain,
+                singleton_threshold=singleton_threshold,
+                minimum_sources=minimum_sources
+            )
+        self._full_cache.put(key, result)
+        return result
+    
+    def _quick_validate_cached(self, content: str, sources: List[str]) -> Dict:
+        """Quick validation memoized across tools (result is shared, read-only)"""
+        key = content_key(content, sources, self._validator_settings())
+        result = self._quick_cache.get(key)
+        if result is None:
+            result = self.validator.quick_validate(content, sources)
+            self._quick_cache.put(key, result)
+        return result
+    
+    def _analyze_claims_cached(self, content: str, sources: List[str]
+                               ) -> Tuple[List[str], List[List[bool]]]:
+        """Claims and their support matrix, shared by risk check and claim analysis"""
+        key = content_key(content, sources)
+        analysis = self._claims_cache.get(key)
+        if analysis is None:
+            claims = self._extract_claims(content)
+            analysis = (claims, self._build_support_matrix(claims, sources))
+            self._claims_cache.put(key, analysis)
+        return analysis
+    
     def _calculate_validation_ratio(self, result: ValidationResult) -> float:
         """Calculate validation ratio from result"""
         if result.singleton_rate > 0:
@@ -641,187 +1037,133 @@ Singleton Rate: {result.singleton_rate*100:.1f}%
     
     def _get_stability_level(self, result: ValidationResult) -> str:
         """Determine stability level"""
-        if result.overall_score >= 0.8 and result.hallucination_risk == "LOW":
-            return "HIGHLY STABLE"
-        elif result.overall_score >= 0.6 and result.hallucination_risk != "HIGH":
-            return "MODERATELY STABLE"
-        else:
-            return "UNSTABLE"
+        return _stability_level(result.overall_score, result.hallucination_risk)
     
     def _get_domain_flags(self, result: ValidationResult, domain: str) -> List[str]:
         """Get domain-specific validation flags"""
-        flags = []
-        
-        if domain == 'consulting':
-            if 'MISSING_UNCERTAINTY_ACKNOWLEDGMENT' in result.validation_flags:
-                flags.append('LACKS_EXECUTIVE_CONFIDENCE_FRAMING')
-            if 'HIGH_SINGLETON_RATE' in result.validation_flags:
-                flags.append('INSUFFICIENT_MARKET_VALIDATION')
-        
-        elif domain == 'technical':
-            if 'COMPUTATIONAL_INTRACTABILITY' in result.validation_flags:
-                flags.append('UNREALISTIC_PERFORMANCE_CLAIMS')
-            if 'UNSUPPORTED_CLAIMS' in result.validation_flags:
-                flags.append('MISSING_TECHNICAL_CITATIONS')
-        
-        elif domain == 'research':
-            if 'HIGH_SINGLETON_RATE' in result.validation_flags:
-                flags.append('NEEDS_PEER_REVIEW')
-            if 'CONFIRMATION_BIAS' in result.validation_flags:
-                flags.append('LACKS_ALTERNATIVE_HYPOTHESES')
-        
-        return flags
+        rules = _DOMAIN_FLAG_MAP.get(domain, ())
+        flags_set = frozenset(result.validation_flags)
+        return [mapped for source_flag, mapped in rules if source_flag in flags_set]
     
     def _extract_claims(self, content: str) -> List[str]:
         """Extract individual claims from content"""
-        import re
-        sentences = re.split(r'[.!?]+', content)
-        return [s.strip() for s in sentences if s.strip() and len(s.strip()) > 20]
+        stripped = (s.strip() for s in _SENT_SPLIT_RE.split(content))
+        return [s for s in stripped if len(s) > 20]
     
-    def _count_unsupported_claims(self, claims: List[str], sources: List[str]) -> int:
-        """Count claims without support"""
-        unsupported = 0
+    def _build_support_matrix(self, claims: List[str],
+                              sources: List[str]) -> List[List[bool]]:
+        """
+        Claims x sources support matrix, computed in a single pass
+        Row i holds whether each source supports claim i
+        """
+        # Whole-word hits resolve with a set lookup; anything else falls
+        # back to the substring scan so partial-word matches still count
+        indexed = [_source_index(source) for source in sources]
+        matrix = []
         for claim in claims:
-            if not any(self._claim_in_source(claim, source) for source in sources):
-                unsupported += 1
-        return unsupported
-    
-    def _claim_in_source(self, claim: str, source: str) -> bool:
-        """Check if claim appears in source"""
-        key_words = [w for w in claim.lower().split() 
-                    if len(w) > 4 and w not in ['that', 'this', 'with', 'from', 'have', 'been']]
-        
-        if len(key_words) < 2:
-            return False
-        
-        matches = sum(1 for word in key_words if word in source.lower())
-        return matches >= len(key_words) * 0.5
-    
-    def _count_support(self, claim: str, sources: List[str]) -> int:
-        """Count how many sources support a claim"""
-        return sum(1 for source in sources if self._claim_in_source(claim, source))
+            key_words = _claim_keywords(claim)
+            if len(key_words) < 2:
+                matrix.append([False] * len(indexed))
+                continue
+            required = len(key_words) * 0.5
+            matrix.append([
+                sum(1 for word in key_words if word in words or word in lowered) >= required
+                for lowered, words in indexed
+            ])
+        return matrix
     
     def _assess_confidence(self, claim: str, support_count: int) -> str:
         """Assess confidence level for a claim"""
-        if support_count >= 3:
-            return "HIGH"
-        elif support_count >= 2:
-            return "MEDIUM"
-        elif support_count >= 1:
-            return "LOW"
-        else:
-            return "UNCERTAIN"
+        return _confidence_for_support(support_count)
     
     def _classify_claim(self, claim: str) -> str:
         """Classify the type of claim"""
-        claim_lower = claim.lower()
-        
-        if any(word in claim_lower for word in ['data shows', 'evidence', 'study']):
-            return "empirical"
-        elif any(word in claim_lower for word in ['therefore', 'thus', 'implies']):
-            return "inferential"
-        elif any(word in claim_lower for word in ['might', 'could', 'possibly']):
-            return "hypothetical"
-        else:
-            return "arbitrary"
+        return _claim_type(claim)
     
     def _calculate_risk_score(self, result: ValidationResult) -> float:
         """Calculate numerical risk score"""
         risk = (
             result.singleton_rate * 0.4 +
             (1 - result.overall_score) * 0.3 +
-            (0.3 if result.hallucination_risk == "HIGH" else 
-             0.15 if result.hallucination_risk == "MEDIUM" else 0)
+            _RISK_WEIGHT.get(result.hallucination_risk, 0.0)
         )
         return round(min(1.0, risk) * 100, 1)
     
     def _get_risk_recommendation(self, result: ValidationResult) -> str:
         """Get risk-specific recommendation"""
-        if result.hallucination_risk == "HIGH":
-            return "Critical: Immediate stabilization needed - add sources and uncertainty acknowledgments"
-        elif result.hallucination_risk == "MEDIUM":
-            return "Moderate: Strengthen claim support and qualify uncertain statements"
-        else:
-            return "Low risk: Output is stable - maintain current validation practices"
+        return _RISK_RECOMMENDATION.get(
+            result.hallucination_risk,
+            "Low risk: Output is stable - maintain current validation practices"
+        )
     
-    def _generate_improvements(self, result: ValidationResult, content: str) -> List[Dict]:
+    def _generate_improvements(self, result: ValidationResult, content: str) -> List[Mapping]:
         """Generate specific improvement suggestions"""
+        # Healthy results need no suggestions
+        if (result.singleton_rate <= 0.2 and
+                _SUGGESTION_FLAGS.isdisjoint(result.validation_flags)):
+            return []
+        
         suggestions = []
         
         if result.singleton_rate > 0.2:
-            suggestions.append({
-                'type': 'reduce_singletons',
-                'priority': 'high',
-                'suggestion': 'Add cross-validation: Include "multiple sources confirm" or "consistently observed"',
-                'example': 'Replace "X is true" with "Multiple studies confirm X"'
-            })
+            suggestions.append(_SINGLETON_SUGGESTION)
         
-        if 'MISSING_UNCERTAINTY_ACKNOWLEDGMENT' in result.validation_flags:
-            suggestions.append({
-                'type': 'add_uncertainty',
-                'priority': 'high',
-                'suggestion': 'Add uncertainty qualifiers where confidence is low',
-                'example': 'Add "preliminary data suggests" or "further research needed"'
-            })
-        
-        if 'CONFIRMATION_BIAS' in result.validation_flags:
-            suggestions.append({
-                'type': 'balance_perspective',
-                'priority': 'medium',
-                'suggestion': 'Include alternative viewpoints or caveats',
-                'example': 'Add "while X is common, exceptions include Y"'
-            })
+        flags_set = frozenset(result.validation_flags)
+        for flag, suggestion in _FLAG_SUGGESTIONS:
+            if flag in flags_set:
+                suggestions.append(suggestion)
         
         return suggestions
     
-    def _apply_suggestion(self, content: str, suggestion: Dict) -> str:
+    def _apply_suggestion(self, content: str, suggestion: Mapping) -> str:
         """Apply improvement suggestion to content (simulated)"""
-        import re
-        
-        if suggestion['type'] == 'add_uncertainty':
-            content = re.sub(
-                r'(\b(?:is|are|will|must)\b)',
-                r'likely \1',
-                content,
-                count=1
-            )
-        
-        elif suggestion['type'] == 'reduce_singletons':
-            content = "Based on multiple sources, " + content
-        
-        return content
+        edit = _SUGGESTION_EDITS.get(suggestion['type'])
+        return edit(content) if edit else content
     
     async def run(self):
         """Run the Lithium MCP server"""
         logger.info("Starting Lithium Validation Framework MCP Server...")
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="Lithium Validation Framework",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={}
+        try:
+            async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="Lithium Validation Framework",
+                        server_version="1.0.0",
+                        capabilities=self.server.get_capabilities(
+                            notification_options=NotificationOptions(),
+                            experimental_capabilities={}
+                        )
                     )
                 )
-            )
+        finally:
+            self._pool.shutdown()
+            if self._cpu_pool is not None:
+                self._cpu_pool.shutdown()
 
 
-async def main():
-    """Main entry point for Lithium"""
-    print("""
+# Startup banner, written to stderr since stdout carries the MCP stream
+_BANNER = """
     ╔══════════════════════════════════════╗
     ║   Lithium - Validation Framework     ║
     ║   Stabilizing AI-generated content   ║
     ╚══════════════════════════════════════╝
     
     Starting server...
-    """)
+    
+"""
+
+
+async def main():
+    """Main entry point for Lithium"""
+    sys.stderr.write(_BANNER)
+    sys.stderr.flush()
     server = LithiumMCPServer()
     await server.run()
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
@@ -41,6 +41,10 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.0.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+        ],
         "notebooks": [
             "jupyter>=1.0.0",
             "matplotlib>=3.5.0",
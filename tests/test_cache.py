@@ -0,0 +1,25 @@
+"""Tests for the shared cache helpers"""
+
+from lithium_validation.core.cache import content_key
+
+
+class TestContentKey:
+
+    def test_stable_and_order_independent(self):
+        assert content_key('text', ['a', 'b'], 'full') == content_key('text', ['b', 'a'], 'full')
+        assert content_key('text', None) == content_key('text', [])
+
+    def test_extra_parameters_are_kept(self):
+        key = content_key('text', ['a'], 'full', 0.2)
+        assert key[1:] == ('full', 0.2)
+        assert key != content_key('text', ['a'], 'detailed', 0.2)
+
+    def test_field_boundaries_are_unambiguous(self):
+        assert content_key('a\x00b', []) != content_key('a', ['b'])
+        assert content_key('x', ['a\x00b']) != content_key('x', ['a', 'b'])
+        assert content_key('ab') != content_key('a', ['b'])
+        assert content_key('x', ['']) != content_key('x')
+
+    def test_lone_surrogates(self):
+        key = content_key('bad \ud800 text', ['\udfff'])
+        assert key != content_key('bad  text', [''])
@@ -0,0 +1,85 @@
+"""Tests for the Lithium MCP server's batch tool"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from lithium_validation.mcp.server import LithiumMCPServer
+
+
+CONTENT = (
+    "Data shows that revenue always grows. The market will double next year. "
+    "Our study proves this strategy is guaranteed to succeed."
+)
+SOURCES = ["Revenue data shows growth in most quarters of the market study."]
+
+
+def make_server():
+    server = LithiumMCPServer()
+    # Keep every validation in-process
+    server._cpu_pool_enabled = False
+    return server
+
+
+@pytest.fixture
+def server():
+    server = make_server()
+    yield server
+    server._pool.shutdown()
+
+
+def run_batch(server, ops):
+    return asyncio.run(server._run_batch({'ops': ops}))
+
+
+def test_batch_runs_mixed_ops_in_order(server):
+    ops = [
+        {'name': 'lithium_validate', 'arguments': {'content': CONTENT, 'sources': SOURCES}},
+        {'name': 'lithium_risk_check', 'arguments': {'content': CONTENT}},
+        {'name': 'lithium_analyze_claims', 'arguments': {'content': CONTENT, 'sources': SOURCES}},
+    ]
+    response = run_batch(server, ops)
+
+    assert response['framework'] == 'Lithium Batch'
+    assert [entry['name'] for entry in response['results']] == [op['name'] for op in ops]
+
+    # Each result matches calling the tool on its own, on a cold server
+    reference = make_server()
+    try:
+        for op, entry in zip(ops, response['results']):
+            handler = reference._handlers[op['name']]
+            assert entry['result'] == asyncio.run(handler(op['arguments']))
+    finally:
+        reference._pool.shutdown()
+
+
+def test_batch_reports_unknown_ops(server):
+    response = run_batch(server, [
+        {'name': 'lithium_missing', 'arguments': {}},
+        {'name': 'lithium_batch', 'arguments': {'ops': []}},
+        {'arguments': {}},
+    ])
+
+    assert [entry['result'] for entry in response['results']] == [
+        "Unknown Lithium tool: lithium_missing",
+        "Unknown Lithium tool: lithium_batch",
+        "Unknown Lithium tool: None",
+    ]
+
+
+def test_batch_isolates_failing_ops(server):
+    response = run_batch(server, [
+        {'name': 'lithium_validate', 'arguments': {}},
+        {'name': 'lithium_validate', 'arguments': {'content': CONTENT}},
+    ])
+    failed, succeeded = (entry['result'] for entry in response['results'])
+
+    assert failed == "Lithium Error: 'content'"
+    assert succeeded['framework'] == 'Lithium'
+    assert 0 <= succeeded['score'] <= 100
+
+
+def test_empty_batch(server):
+    assert run_batch(server, [])['results'] == []
@@ -0,0 +1,210 @@
+"""Tests for the validation interface's caching, source handles, batches and file reads"""
+
+import os
+import threading
+
+import pytest
+
+from lithium_validation.core import validation_interface
+from lithium_validation.core.validation_engine import OutputValidator
+from lithium_validation.core.validation_interface import (
+    ResultCache, SourceHandle, ValidationInterface, read_text
+)
+
+
+CONTENT = (
+    "Data shows that revenue always grows. The market will double next year. "
+    "Our study proves this strategy is guaranteed to succeed."
+)
+# Fully supported by SOURCES, so it passes only under the default settings
+SUPPORTED = "Revenue data shows growth in quarters. Market study found revenue growth."
+SOURCES = [
+    "Revenue data shows growth in most quarters of the market study.",
+    "The market study found revenue growth varies by region.",
+]
+BATCH = [
+    f"Claim {i}: the latest market data shows revenue will always grow by {i}%."
+    for i in range(12)
+]
+
+
+def strip_timestamp(result):
+    data = result.to_dict()
+    del data['timestamp']
+    return data
+
+
+@pytest.fixture
+def interface():
+    return ValidationInterface()
+
+
+class TestResultCache:
+
+    def test_miss_returns_none(self):
+        assert ResultCache().get('missing') is None
+
+    def test_hit_returns_equal_copy(self, interface):
+        result = interface.full_validate(CONTENT, SOURCES)
+        cache = ResultCache()
+        cache.put('key', result)
+
+        cached = cache.get('key')
+        assert cached is not result
+        assert strip_timestamp(cached) == strip_timestamp(result)
+
+        # Mutating a returned copy does not affect the cache
+        cached.validation_flags.append('EDITED')
+        assert 'EDITED' not in cache.get('key').validation_flags
+
+    def test_entries_expire_after_ttl(self, interface, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(validation_interface.time, 'monotonic', lambda: now[0])
+        cache = ResultCache(ttl=10.0)
+        cache.put('key', interface.full_validate(CONTENT))
+
+        now[0] += 5.0
+        assert cache.get('key') is not None
+
+        now[0] += 6.0
+        assert cache.get('key') is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self, interface):
+        result = interface.full_validate(CONTENT)
+        cache = ResultCache(maxsize=2)
+        cache.put('a', result)
+        cache.put('b', result)
+        cache.get('a')
+        cache.put('c', result)
+
+        assert cache.get('a') is not None
+        assert cache.get('b') is None
+        assert cache.get('c') is not None
+
+
+class TestInterfaceCaching:
+
+    def test_repeat_validation_is_served_from_cache(self, interface, monkeypatch):
+        first = interface.full_validate(CONTENT, SOURCES)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("validated twice")
+        monkeypatch.setattr(OutputValidator, 'validate_output', fail)
+
+        second = interface.full_validate(CONTENT, SOURCES)
+        assert strip_timestamp(second) == strip_timestamp(first)
+        # Cache hits are still recorded in the statistics
+        assert interface.get_statistics()['total_validations'] == 2
+
+    def test_overrides_do_not_reuse_cached_result(self, interface):
+        default = interface.full_validate(SUPPORTED, SOURCES)
+        strict = interface.full_validate(SUPPORTED, SOURCES, minimum_sources=5)
+        no_singletons = interface.full_validate(SUPPORTED, SOURCES, singleton_threshold=0.0)
+
+        assert default.passed
+        assert not strict.passed
+        assert 'UNSUPPORTED_CLAIMS' in strict.validation_flags
+        assert not no_singletons.passed
+        # The overrides applied to those calls only
+        assert (interface.validator.singleton_threshold, interface.validator.minimum_sources) == (0.2, 2)
+        assert strip_timestamp(interface.full_validate(SUPPORTED, SOURCES)) == strip_timestamp(default)
+
+    def test_with_settings_copies_validator(self, interface):
+        validator = interface.validator
+        assert validator.with_settings() is validator
+
+        tuned = validator.with_settings(singleton_threshold=0.5, minimum_sources=3)
+        assert tuned is not validator
+        assert (tuned.singleton_threshold, tuned.minimum_sources) == (0.5, 3)
+        assert (validator.singleton_threshold, validator.minimum_sources) == (0.2, 2)
+
+    def test_changed_thresholds_invalidate_cache(self, interface):
+        before = interface.quick_validate(SUPPORTED, SOURCES)
+        interface.validator.minimum_sources = 5
+        after = interface.quick_validate(SUPPORTED, SOURCES)
+
+        assert 'UNSUPPORTED_CLAIMS' not in before['key_issues']
+        assert 'UNSUPPORTED_CLAIMS' in after['key_issues']
+        assert after['score'] < before['score']
+
+
+class TestSourceHandle:
+
+    def test_prepare_sources(self, interface):
+        handle = interface.prepare_sources(SOURCES)
+
+        assert isinstance(handle, SourceHandle)
+        assert handle.texts == tuple(SOURCES)
+        assert handle.lowered == tuple(source.lower() for source in SOURCES)
+        assert interface.prepare_sources(handle) is handle
+        assert interface.prepare_sources(None).texts == ()
+
+    def test_handle_matches_source_list(self, interface):
+        handle = interface.prepare_sources(SOURCES)
+
+        assert (strip_timestamp(interface.full_validate(CONTENT, handle)) ==
+                strip_timestamp(ValidationInterface().full_validate(CONTENT, SOURCES)))
+        assert (interface.quick_validate(CONTENT, handle) ==
+                ValidationInterface().quick_validate(CONTENT, SOURCES))
+
+
+class TestBatchValidation:
+
+    def test_batch_matches_individual_validations(self, interface):
+        expected = [ValidationInterface().quick_validate(content, SOURCES)
+                    for content in BATCH]
+        assert interface.batch_validate(BATCH, SOURCES) == expected
+
+    def test_iter_validate_yields_in_order(self, interface):
+        expected = ValidationInterface().batch_validate(BATCH, SOURCES)
+        pairs = list(interface.iter_validate(iter(BATCH), SOURCES))
+
+        assert [content for content, _ in pairs] == BATCH
+        assert [result for _, result in pairs] == expected
+
+    def test_parallel_batch_matches_serial(self, interface):
+        serial = ValidationInterface().batch_validate(BATCH, SOURCES)
+        parallel = interface.batch_validate(BATCH, SOURCES, max_workers=2)
+
+        assert parallel == serial
+        # Results computed in workers are cached and recorded here
+        assert len(interface.cache) == len(BATCH)
+        assert interface.get_statistics()['total_validations'] == len(BATCH)
+
+    def test_parallel_batch_reuses_cached_results(self, interface):
+        interface.batch_validate(BATCH[:4], SOURCES)
+        parallel = interface.batch_validate(BATCH, SOURCES, max_workers=2)
+
+        assert parallel == ValidationInterface().batch_validate(BATCH, SOURCES)
+        assert interface.get_statistics()['total_validations'] == 4 + len(BATCH)
+
+
+class TestReadText:
+
+    def test_matches_open_read(self, tmp_path):
+        path = tmp_path / "content.txt"
+        path.write_bytes(b"first line\r\nsecond line\rthird line\n")
+
+        with open(path) as f:
+            assert read_text(str(path)) == f.read()
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert read_text(str(path)) == ''
+
+    @pytest.mark.skipif(not os.path.isdir('/dev/fd'), reason="needs /dev/fd")
+    def test_reads_from_pipe(self):
+        read_fd, write_fd = os.pipe()
+
+        def write():
+            with os.fdopen(write_fd, 'wb') as f:
+                f.write(CONTENT.encode())
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            assert read_text(f'/dev/fd/{read_fd}') == CONTENT
+        finally:
+            writer.join()
+            os.close(read_fd)
@@ -0,0 +1,96 @@
+"""Tests for the standalone validation MCP server's encoding and config reload"""
+
+import asyncio
+import base64
+import json
+import os
+
+import pytest
+
+pytest.importorskip("mcp")
+
+import validation_mcp_server
+from validation_mcp_server import ValidationMCPServer, _dumps, _msgpack_resource
+
+
+CONTENT = (
+    "Data shows that revenue always grows. The market will double next year. "
+    "Our study proves this strategy is guaranteed to succeed."
+)
+SOURCES = ["Revenue data shows growth in most quarters of the market study."]
+
+
+@pytest.fixture
+def server():
+    server = ValidationMCPServer()
+    yield server
+    server._pool.shutdown()
+
+
+class TestMsgpackEncoding:
+
+    def test_round_trip_matches_json(self, server):
+        msgspec = pytest.importorskip("msgspec")
+        result = asyncio.run(server._validate_output(
+            {'content': CONTENT, 'sources': SOURCES, 'mode': 'detailed'}
+        ))
+        resource = _msgpack_resource(result)
+
+        assert resource.type == "resource"
+        assert resource.resource.mimeType == "application/msgpack"
+        decoded = msgspec.msgpack.decode(base64.b64decode(resource.resource.blob))
+        assert decoded == json.loads(_dumps(result))
+
+    def test_missing_msgspec_is_reported(self, monkeypatch):
+        monkeypatch.setattr(validation_mcp_server, 'msgspec', None)
+        with pytest.raises(RuntimeError, match="msgspec"):
+            _msgpack_resource({'score': 1})
+
+
+class TestConfigReload:
+
+    @pytest.fixture
+    def config_file(self, server, tmp_path, monkeypatch):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({'version': 1}))
+        server._config_path = path
+        server.config = server._load_config()
+
+        now = [1000.0]
+        monkeypatch.setattr(validation_mcp_server.time, 'monotonic', lambda: now[0])
+        server._config_checked_at = now[0]
+        return path, now
+
+    def rewrite(self, path, text, mtime):
+        path.write_text(text)
+        os.utime(path, (mtime, mtime))
+
+    def test_changed_file_is_reloaded(self, server, config_file):
+        path, now = config_file
+        self.rewrite(path, json.dumps({'version': 2}), path.stat().st_mtime + 10)
+
+        now[0] += validation_mcp_server._CONFIG_CHECK_INTERVAL
+        server._refresh_config()
+        assert server.config == {'version': 2}
+
+    def test_checks_are_throttled(self, server, config_file):
+        path, now = config_file
+        self.rewrite(path, json.dumps({'version': 2}), path.stat().st_mtime + 10)
+
+        now[0] += validation_mcp_server._CONFIG_CHECK_INTERVAL / 2
+        server._refresh_config()
+        assert server.config == {'version': 1}
+
+        # A configured interval replaces the default
+        server.config['config_check_interval'] = 0
+        server._refresh_config()
+        assert server.config == {'version': 2}
+
+    def test_broken_file_keeps_previous_config(self, server, config_file):
+        path, now = config_file
+        self.rewrite(path, "{not json", path.stat().st_mtime + 10)
+
+        now[0] += validation_mcp_server._CONFIG_CHECK_INTERVAL
+        server._refresh_config()
+        assert server.config == {'version': 1}
+        assert server._config_mtime == path.stat().st_mtime
@@ -9,6 +9,7 @@ This system implements a three-stage validation process:
 3. Quality Assurance Verification
 """
 
+import copy
 import json
 import re
 from typing import Dict, List, Tuple, Optional, Any
@@ -61,6 +62,25 @@ class OutputValidator:
             ConfidenceLevel.LOW: 0.5,
             ConfidenceLevel.UNCERTAIN: 0.0
         }
+    
+    def with_settings(self, singleton_threshold: Optional[float] = None,
+                      minimum_sources: Optional[int] = None) -> 'OutputValidator':
+        """
+        Validator using per-call threshold overrides
+        
+        Returns a copy rather than mutating this instance, so concurrent
+        callers with different settings never see each other's values.
+        None keeps the current value; with no overrides, self is returned.
+        """
+        if singleton_threshold is None and minimum_sources is None:
+            return self
+        
+        validator = copy.copy(self)
+        if singleton_threshold is not None:
+            validator.singleton_threshold = singleton_threshold
+        if minimum_sources is not None:
+            validator.minimum_sources = minimum_sources
+        return validator
         
     def validate_output(self, 
                        content: str,
@@ -300,16 +320,18 @@ class OutputValidator:
         scope_indicators = ['specifically', 'limited to', 'within', 'scope', 
                            'boundaries', 'constraints']
         
-        has_scope_language = any(ind in content.lower() for ind in scope_indicators)
+        content_lower = content.lower()
+        has_scope_language = any(ind in content_lower for ind in scope_indicators)
         has_scope_metadata = 'scope' in metadata
         
         return has_scope_language or has_scope_metadata
     
     def _check_temporal_context(self, content: str) -> Dict[str, bool]:
         """Check temporal context markers"""
+        content_lower = content.lower()
         return {
             'has_dates': bool(re.search(r'\b\d{4}\b', content)),
-            'has_time_markers': any(word in content.lower() for word in 
+            'has_time_markers': any(word in content_lower for word in 
                                    ['currently', 'recently', 'historically', 
                                     'previously', 'future']),
             'has_version_info': bool(re.search(r'v\d+|\d+\.\d+', content))
@@ -322,7 +344,8 @@ class OutputValidator:
             "requires further", "unable to", "beyond scope", "cannot verify"
         ]
         
-        return any(phrase in content.lower() for phrase in abstention_phrases)
+        content_lower = content.lower()
+        return any(phrase in content_lower for phrase in abstention_phrases)
     
     def _identify_singletons(self, content: str, metadata: Dict) -> List[str]:
         """Identify singleton claims (appearing only once in sources)"""
@@ -348,7 +371,8 @@ class OutputValidator:
         if len(key_words) < 2:
             return False
             
-        matches = sum(1 for word in key_words if word in source.lower())
+        source_lower = source.lower()
+        matches = sum(1 for word in key_words if word in source_lower)
         return matches >= len(key_words) * 0.5
     
     def _assess_claim_confidence(self, claim: str, metadata: Dict) -> ConfidenceLevel:
@@ -391,27 +415,29 @@ class OutputValidator:
     
     def _check_biases(self, content: str) -> Dict[str, bool]:
         """Check for various biases mentioned in the paper"""
+        # Lowercase once; the individual checks only do substring tests
+        content_lower = content.lower()
         return {
-            'confirmation_bias': self._check_confirmation_bias(content),
-            'recency_bias': self._check_recency_bias(content),
-            'geographic_bias': self._check_geographic_bias(content)
+            'confirmation_bias': self._check_confirmation_bias(content_lower),
+            'recency_bias': self._check_recency_bias(content_lower),
+            'geographic_bias': self._check_geographic_bias(content_lower)
         }
     
-    def _check_confirmation_bias(self, content: str) -> bool:
-        """Check for confirmation bias indicators"""
+    def _check_confirmation_bias(self, content_lower: str) -> bool:
+        """Check lowercased content for confirmation bias indicators"""
         one_sided_terms = ['always', 'never', 'all', 'none', 'every', 'no one']
-        return any(term in content.lower() for term in one_sided_terms)
+        return any(term in content_lower for term in one_sided_terms)
     
-    def _check_recency_bias(self, content: str) -> bool:
-        """Check for recency bias"""
+    def _check_recency_bias(self, content_lower: str) -> bool:
+        """Check lowercased content for recency bias"""
         recency_terms = ['latest', 'newest', 'most recent', 'cutting-edge', 'state-of-the-art']
-        return any(term in content.lower() for term in recency_terms)
+        return any(term in content_lower for term in recency_terms)
     
-    def _check_geographic_bias(self, content: str) -> bool:
-        """Check for geographic bias"""
+    def _check_geographic_bias(self, content_lower: str) -> bool:
+        """Check lowercased content for geographic bias"""
         # Simple check - in production use more sophisticated location detection
         locations = ['america', 'europe', 'asia', 'western', 'eastern']
-        return sum(1 for loc in locations if loc in content.lower()) >= 2
+        return sum(1 for loc in locations if loc in content_lower) >= 2
     
     def _calculate_hallucination_risk(self, quality_scores: Dict,
                                      generation_assessment: Dict) -> float:
@@ -6,6 +6,7 @@ Provides quick validation checks and report generation
 
 import json
 import sys
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 from datetime import datetime
@@ -24,6 +25,8 @@ class ValidationInterface:
         """Initialize with optional configuration"""
         self.validator = OutputValidator()
         self.history = []
+        # Guards history; the MCP server validates from worker threads
+        self._history_lock = threading.Lock()
         self.config = self._load_config(config_path) if config_path else {}
         
     def _load_config(self, config_path: str) -> Dict:
@@ -50,7 +53,7 @@ class ValidationInterface:
         result = self.validator.validate_output(content, metadata)
         
         # Store in history
-        self.history.append(result)
+        self._record(result)
         
         # Create simplified output
         return {
@@ -64,7 +67,9 @@ class ValidationInterface:
     def full_validate(self, content: str, 
                      sources: List[str] = None,
                      scope: str = None,
-                     domain: str = None) -> ValidationResult:
+                     domain: str = None,
+                     singleton_threshold: Optional[float] = None,
+                     minimum_sources: Optional[int] = None) -> ValidationResult:
         """
         Full validation with comprehensive metadata
         
@@ -73,6 +78,8 @@ class ValidationInterface:
             sources: Optional list of source texts
             scope: Scope definition
             domain: Domain/field of the content
+            singleton_threshold: Override for this call only
+            minimum_sources: Override for this call only
             
         Returns:
             Complete ValidationResult
@@ -84,19 +91,28 @@ class ValidationInterface:
             'timestamp': datetime.now().isoformat()
         }
         
-        result = self.validator.validate_output(content, metadata)
-        self.history.append(result)
+        validator = self.validator.with_settings(singleton_threshold, minimum_sources)
+        result = validator.validate_output(content, metadata)
+        self._record(result)
         
         return result
     
+    def _record(self, result: ValidationResult):
+        """Store a result in history"""
+        with self._history_lock:
+            self.history.append(result)
+    
     def generate_report(self, result: ValidationResult, 
-                       format: str = 'markdown') -> str:
+                       format: str = 'markdown',
+                       include_recommendations: bool = True) -> str:
         """
         Generate a validation report
         
         Args:
             result: ValidationResult to report on
             format: Output format ('markdown', 'json', 'text')
+            include_recommendations: Include the recommendations section
+                (markdown and text formats)
             
         Returns:
             Formatted report string
@@ -104,13 +120,14 @@ class ValidationInterface:
         if format == 'json':
             return json.dumps(result.to_dict(), indent=2)
         elif format == 'markdown':
-            return self._generate_markdown_report(result)
+            return self._generate_markdown_report(result, include_recommendations)
         else:
-            return self._generate_text_report(result)
+            return self._generate_text_report(result, include_recommendations)
     
-    def _generate_markdown_report(self, result: ValidationResult) -> str:
+    def _generate_markdown_report(self, result: ValidationResult,
+                                  include_recommendations: bool = True) -> str:
         """Generate markdown format report"""
-        report = f"""# Validation Report
+        parts = [f"""# Validation Report
 
 **Generated:** {result.timestamp}  
 **Overall Score:** {result.overall_score*100:.1f}%  
@@ -119,11 +136,11 @@ class ValidationInterface:
 
 ## Confidence Distribution
 
-"""
+"""]
         for level, count in result.confidence_distribution.items():
-            report += f"- **{level}:** {count} claims\n"
+            parts.append(f"- **{level}:** {count} claims\n")
         
-        report += f"""
+        parts.append(f"""
 
 ## Key Metrics
 
@@ -132,17 +149,19 @@ class ValidationInterface:
 
 ## Issues Found
 
-"""
+""")
         for flag in result.validation_flags:
-            report += f"- {flag.replace('_', ' ').title()}\n"
+            parts.append(f"- {flag.replace('_', ' ').title()}\n")
         
-        report += "\n## Recommendations\n\n"
-        for i, rec in enumerate(result.recommendations, 1):
-            report += f"{i}. {rec}\n"
+        if include_recommendations:
+            parts.append("\n## Recommendations\n\n")
+            for i, rec in enumerate(result.recommendations, 1):
+                parts.append(f"{i}. {rec}\n")
         
-        return report
+        return "".join(parts)
     
-    def _generate_text_report(self, result: ValidationResult) -> str:
+    def _generate_text_report(self, result: ValidationResult,
+                              include_recommendations: bool = True) -> str:
         """Generate plain text report"""
         report = f"""
 VALIDATION REPORT
@@ -157,9 +176,10 @@ ISSUES:
         for flag in result.validation_flags:
             report += f"  - {flag.replace('_', ' ')}\n"
         
-        report += "\nRECOMMENDATIONS:\n"
-        for i, rec in enumerate(result.recommendations, 1):
-            report += f"  {i}. {rec}\n"
+        if include_recommendations:
+            report += "\nRECOMMENDATIONS:\n"
+            for i, rec in enumerate(result.recommendations, 1):
+                report += f"  {i}. {rec}\n"
         
         return report
     
@@ -207,6 +227,11 @@ ISSUES:
         
         return results
     
+    def reset_statistics(self):
+        """Clear validation history so statistics start fresh"""
+        with self._history_lock:
+            self.history.clear()
+    
     def get_statistics(self) -> Dict:
         """
         Get statistics from validation history
@@ -214,23 +239,27 @@ ISSUES:
         Returns:
             Statistics dictionary
         """
-        if not self.history:
+        # Snapshot, so every figure below covers the same results
+        with self._history_lock:
+            history = list(self.history)
+        
+        if not history:
             return {'message': 'No validation history available'}
         
-        passed_count = sum(1 for r in self.history if r.passed)
-        total_count = len(self.history)
+        passed_count = sum(1 for r in history if r.passed)
+        total_count = len(history)
         
-        avg_score = sum(r.overall_score for r in self.history) / total_count
-        avg_singleton = sum(r.singleton_rate for r in self.history) / total_count
+        avg_score = sum(r.overall_score for r in history) / total_count
+        avg_singleton = sum(r.singleton_rate for r in history) / total_count
         
         risk_distribution = {
-            'LOW': sum(1 for r in self.history if r.hallucination_risk == 'LOW'),
-            'MEDIUM': sum(1 for r in self.history if r.hallucination_risk == 'MEDIUM'),
-            'HIGH': sum(1 for r in self.history if r.hallucination_risk == 'HIGH')
+            'LOW': sum(1 for r in history if r.hallucination_risk == 'LOW'),
+            'MEDIUM': sum(1 for r in history if r.hallucination_risk == 'MEDIUM'),
+            'HIGH': sum(1 for r in history if r.hallucination_risk == 'HIGH')
         }
         
         common_flags = {}
-        for result in self.history:
+        for result in history:
             for flag in result.validation_flags:
                 common_flags[flag] = common_flags.get(flag, 0) + 1
         